@@ -11,37 +11,240 @@ Usage:
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import os
 import json
-import glob
 from datetime import datetime, timedelta
 
+from fast_agg import day_counts
+
+
+@st.cache_data(ttl=30)
+def list_checkpoints():
+    """Return checkpoint directories, newest first."""
+    # scandir reports is_dir() from the directory entry, without a stat per path
+    with os.scandir(".") as entries:
+        return sorted(
+            [e.name for e in entries if e.name.startswith("q2b_audit_") and e.is_dir()],
+            reverse=True
+        )
+
 
 def load_latest_checkpoint():
     """Find and return the latest checkpoint directory."""
-    checkpoints = sorted(glob.glob("q2b_audit_*"), reverse=True)
-    checkpoints = [d for d in checkpoints if os.path.isdir(d)]
+    checkpoints = list_checkpoints()
     return checkpoints[0] if checkpoints else None
 
 
-def load_data(checkpoint_dir):
-    """Load data from checkpoint directory."""
+def _get_mtime(path):
+    """Return the modification time of a file, or None if it does not exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _count_per_day(dates):
+    """Count articles per calendar day, returning a Series indexed by date.
+
+    Days are bucketed as integer offsets from the first day, which avoids the
+    hashing cost of a groupby on large checkpoints. Days without articles are
+    omitted, as with groupby().size().
+    """
+    days = dates.to_numpy(dtype='datetime64[D]').view(np.int64)
+    if len(days) == 0:
+        return pd.Series(dtype='int64', index=pd.DatetimeIndex([]))
+    
+    first = days.min()
+    counts = day_counts(days - first, int(days.max() - first) + 1)
+    index = pd.DatetimeIndex(np.arange(first, first + len(counts)).astype('datetime64[D]'))
+    daily = pd.Series(counts, index=index)
+    return daily[daily > 0]
+
+
+def _load_csv(csv_file):
+    """Parse articles.csv and derive the date columns used by the dashboard."""
+    # Arrow parser and string buffers; only the columns the dashboard reads.
+    # date_parsed is pinned to string so pyarrow does not infer a date type.
+    df = pd.read_csv(
+        csv_file,
+        engine='pyarrow',
+        dtype_backend='pyarrow',
+        usecols=['title', 'date_parsed', 'url'],
+        dtype={'date_parsed': 'string[pyarrow]'},
+    )
+    
+    # Parse dates once here so reruns never re-convert strings
+    df['has_date'] = (df['date_parsed'] != 'UNKNOWN_DATE').to_numpy(dtype=bool, na_value=False)
+    df['dt'] = pd.to_datetime(df['date_parsed'].where(df['has_date']), format='%Y-%m-%d', cache=True)
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def load_data(checkpoint_dir, csv_mtime=None, report_mtime=None):
+    """Load data from checkpoint directory.
+
+    The mtime arguments are part of the cache key: Streamlit keeps the parsed
+    frame in memory across reruns and reloads it when a file changes. The
+    articles.parquet sidecar is used when it is at least as new as the CSV.
+    """
     csv_file = os.path.join(checkpoint_dir, "articles.csv")
+    parquet_file = os.path.join(checkpoint_dir, "articles.parquet")
     report_file = os.path.join(checkpoint_dir, "report.json")
     
     if not os.path.exists(csv_file):
-        return None, None
+        return None, None, None
     
-    df = pd.read_csv(csv_file)
+    parquet_mtime = _get_mtime(parquet_file)
+    if parquet_mtime is not None and parquet_mtime >= os.path.getmtime(csv_file):
+        df = pd.read_parquet(parquet_file, engine='pyarrow')
+    else:
+        df = _load_csv(csv_file)
+        # Columnar sidecar, including the parsed date columns, for the next
+        # load; skipped when the checkpoint directory is not writable
+        try:
+            df.to_parquet(parquet_file, engine='pyarrow', compression='zstd', index=False)
+        except OSError:
+            pass
+    
+    # Articles per day (DatetimeIndex); date filters slice this instead of rescanning rows
+    daily = _count_per_day(df.loc[df['has_date'], 'dt'])
     
     report = None
     if os.path.exists(report_file):
         with open(report_file, 'r', encoding='utf-8') as f:
             report = json.load(f)
     
-    return df, report
+    return df, report, daily
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def search_titles(_df, data_key, term):
+    """Return the row positions whose title contains term (case-insensitive).
+
+    _df is not hashed by Streamlit; data_key identifies the loaded dataset.
+    """
+    matches = _df['title'].str.contains(term, case=False, regex=False, na=False)
+    return np.flatnonzero(matches.to_numpy(dtype=bool))
+
+
+# Windows longer than this are plotted as weekly totals; thousands of daily
+# points are indistinguishable on screen but inflate the Plotly payload
+MAX_DAILY_PLOT_DAYS = 365
+
+
+def _is_long_window(start, end):
+    return (end - start).days > MAX_DAILY_PLOT_DAYS
+
+
+def _daily_window(daily, start, end, downsample=False):
+    """Return the per-day counts between start and end as a Date/Article Count frame.
+
+    With downsample=True, long windows are summed per week instead.
+    """
+    sub = daily.loc[start:end]
+    if downsample and _is_long_window(start, end):
+        sub = sub.resample('W').sum()
+    return pd.DataFrame({'Date': sub.index, 'Article Count': sub.to_numpy()})
+
+
+# Figure builders are cached per (dataset, date window): interactions that do
+# not change the window, such as typing a search term, reuse the same figures.
+# The leading underscore keeps Streamlit from hashing the daily Series.
+
+@st.cache_resource(max_entries=32)
+def build_daily_bar(data_key, start, end, _daily):
+    """Bar chart of articles published per day (per week for long windows)."""
+    daily_counts = _daily_window(_daily, start, end, downsample=True)
+    period = 'Week' if _is_long_window(start, end) else 'Day'
+    fig = px.bar(
+        daily_counts,
+        x='Date',
+        y='Article Count',
+        title=f'Articles Published Per {period}',
+        labels={'Article Count': 'Number of Articles', 'Date': 'Publication Date'},
+        color='Article Count',
+        color_continuous_scale='Reds'
+    )
+    fig.update_layout(height=500)
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def build_timeline(data_key, start, end, _daily):
+    """Line chart of output over time with its average (per week for long windows)."""
+    counts = _daily_window(_daily, start, end, downsample=True)
+    period = 'Week' if _is_long_window(start, end) else 'Day'
+    average = counts['Article Count'].mean()
+    fig = px.line(
+        counts,
+        x='Date',
+        y='Article Count',
+        title=f'Publication Timeline (Articles Per {period})',
+        markers=True
+    )
+    fig.add_hline(
+        y=average,
+        line_dash="dash",
+        line_color="red",
+        annotation_text=f"Average: {average:.0f} per {period.lower()}"
+    )
+    fig.update_layout(height=500)
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def build_histogram(data_key, start, end, _daily):
+    """Histogram of daily article counts."""
+    daily_counts = _daily_window(_daily, start, end)
+    fig = px.histogram(
+        daily_counts,
+        x='Article Count',
+        nbins=30,
+        title='Distribution of Daily Article Counts',
+        labels={'Article Count': 'Articles Per Day', 'count': 'Frequency'}
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def build_day_of_week_bar(data_key, start, end, _daily):
+    """Bar chart of articles per weekday."""
+    sub = _daily.loc[start:end]
+    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    # Ordered categorical keys: counts come back in weekday order, empty days as 0
+    day_of_week = pd.Categorical.from_codes(sub.index.dayofweek, categories=day_order, ordered=True)
+    day_counts = sub.groupby(day_of_week, observed=False).sum()
+    
+    return px.bar(
+        x=day_counts.index.astype(str),
+        y=day_counts.values,
+        title='Articles by Day of Week',
+        labels={'x': 'Day', 'y': 'Article Count'},
+        color=day_counts.values,
+        color_continuous_scale='Blues'
+    )
+
+
+@st.cache_resource(max_entries=32)
+def build_month_bar(data_key, start, end, _daily):
+    """Bar chart of articles per calendar month."""
+    sub = _daily.loc[start:end]
+    # Group on the period codes and only format the (few) resulting labels
+    month_counts = sub.groupby(sub.index.to_period('M')).sum()
+    month_counts.index = month_counts.index.astype(str)
+    
+    return px.bar(
+        x=month_counts.index,
+        y=month_counts.values,
+        title='Articles by Month',
+        labels={'x': 'Month', 'y': 'Article Count'},
+        color=month_counts.values,
+        color_continuous_scale='Greens'
+    )
 
 
 def main():
@@ -60,8 +263,7 @@ def main():
     # Sidebar - Checkpoint selection
     st.sidebar.header("⚙️ Configuration")
     
-    checkpoints = sorted(glob.glob("q2b_audit_*"), reverse=True)
-    checkpoints = [d for d in checkpoints if os.path.isdir(d)]
+    checkpoints = list_checkpoints()
     
     if not checkpoints:
         st.error("❌ No checkpoint directories found. Please run the scraper first.")
@@ -74,8 +276,14 @@ def main():
         help="Choose a checkpoint directory to analyze"
     )
     
-    # Load data
-    df, report = load_data(selected_checkpoint)
+    # Load data (cached; keyed on the file mtimes so new checkpoints reload)
+    csv_mtime = _get_mtime(os.path.join(selected_checkpoint, "articles.csv"))
+    data_key = (selected_checkpoint, csv_mtime)
+    df, report, daily = load_data(
+        selected_checkpoint,
+        csv_mtime,
+        _get_mtime(os.path.join(selected_checkpoint, "report.json")),
+    )
     
     if df is None:
         st.error(f"❌ Could not load data from {selected_checkpoint}")
@@ -98,14 +306,11 @@ def main():
         st.metric("Total Articles", f"{len(df):,}")
     
     # Calculate metrics for all columns
-    known_dates = df[df['date_parsed'] != 'UNKNOWN_DATE']
-    unique_days = 0
+    unique_days = len(daily)
     avg_per_day = 0
     
-    if len(known_dates) > 0:
-        unique_days = known_dates['date_parsed'].nunique()
-        if unique_days > 0:
-            avg_per_day = len(known_dates) / unique_days
+    if unique_days > 0:
+        avg_per_day = daily.sum() / unique_days
     
     with col2:
         if avg_per_day > 0:
@@ -132,13 +337,9 @@ def main():
     # Date filter
     st.header("🔍 Filter Data")
     
-    known_dates = df[df['date_parsed'] != 'UNKNOWN_DATE'].copy()
-    
-    if len(known_dates) > 0:
-        known_dates['date_parsed'] = pd.to_datetime(known_dates['date_parsed'])
-        
-        min_date = known_dates['date_parsed'].min()
-        max_date = known_dates['date_parsed'].max()
+    if unique_days > 0:
+        min_date = daily.index.min()
+        max_date = daily.index.max()
         
         col1, col2 = st.columns(2)
         with col1:
@@ -157,12 +358,12 @@ def main():
             )
         
         # Filter data
-        filtered_df = known_dates[
-            (known_dates['date_parsed'] >= pd.to_datetime(start_date)) &
-            (known_dates['date_parsed'] <= pd.to_datetime(end_date))
-        ]
+        start_ts = pd.to_datetime(start_date)
+        end_ts = pd.to_datetime(end_date)
+        sub = daily.loc[start_ts:end_ts]
+        num_filtered = int(sub.sum())
         
-        st.info(f"📅 Showing {len(filtered_df):,} articles from {start_date} to {end_date}")
+        st.info(f"📅 Showing {num_filtered:,} articles from {start_date} to {end_date}")
         
         st.markdown("---")
         
@@ -171,50 +372,15 @@ def main():
         
         # Daily article count
         st.subheader("Daily Article Production")
-        daily_counts = filtered_df.groupby(filtered_df['date_parsed'].dt.date).size().reset_index()
-        daily_counts.columns = ['Date', 'Article Count']
-        
-        fig = px.bar(
-            daily_counts,
-            x='Date',
-            y='Article Count',
-            title='Articles Published Per Day',
-            labels={'Article Count': 'Number of Articles', 'Date': 'Publication Date'},
-            color='Article Count',
-            color_continuous_scale='Reds'
-        )
-        fig.update_layout(height=500)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_daily_bar(data_key, start_ts, end_ts, daily), use_container_width=True)
         
         # Timeline
         st.subheader("Publication Timeline")
-        fig = px.line(
-            daily_counts,
-            x='Date',
-            y='Article Count',
-            title='Publication Timeline',
-            markers=True
-        )
-        fig.add_hline(
-            y=daily_counts['Article Count'].mean(),
-            line_dash="dash",
-            line_color="red",
-            annotation_text=f"Average: {daily_counts['Article Count'].mean():.0f}"
-        )
-        fig.update_layout(height=500)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_timeline(data_key, start_ts, end_ts, daily), use_container_width=True)
         
         # Distribution histogram
         st.subheader("Distribution Analysis")
-        fig = px.histogram(
-            daily_counts,
-            x='Article Count',
-            nbins=30,
-            title='Distribution of Daily Article Counts',
-            labels={'Article Count': 'Articles Per Day', 'count': 'Frequency'}
-        )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_histogram(data_key, start_ts, end_ts, daily), use_container_width=True)
         
         # Hourly pattern (if we had time data - simulated for demo)
         st.subheader("Publication Pattern")
@@ -222,34 +388,11 @@ def main():
         
         with col1:
             # Day of week analysis
-            filtered_df['day_of_week'] = filtered_df['date_parsed'].dt.day_name()
-            day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            day_counts = filtered_df['day_of_week'].value_counts().reindex(day_order, fill_value=0)
-            
-            fig = px.bar(
-                x=day_counts.index,
-                y=day_counts.values,
-                title='Articles by Day of Week',
-                labels={'x': 'Day', 'y': 'Article Count'},
-                color=day_counts.values,
-                color_continuous_scale='Blues'
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_day_of_week_bar(data_key, start_ts, end_ts, daily), use_container_width=True)
         
         with col2:
             # Monthly trend
-            filtered_df['year_month'] = filtered_df['date_parsed'].dt.to_period('M').astype(str)
-            month_counts = filtered_df['year_month'].value_counts().sort_index()
-            
-            fig = px.bar(
-                x=month_counts.index,
-                y=month_counts.values,
-                title='Articles by Month',
-                labels={'x': 'Month', 'y': 'Article Count'},
-                color=month_counts.values,
-                color_continuous_scale='Greens'
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_month_bar(data_key, start_ts, end_ts, daily), use_container_width=True)
         
         st.markdown("---")
         
@@ -259,19 +402,25 @@ def main():
         # Search
         search_term = st.text_input("🔍 Search articles by title", "")
         
-        display_df = filtered_df.copy()
+        # Only the first 100 matching rows are materialised for the table
+        columns = ['title', 'date_parsed', 'url']
         if search_term:
-            display_df = display_df[
-                display_df['title'].str.contains(search_term, case=False, na=False)
-            ]
+            hits = df.iloc[search_titles(df, data_key, search_term)]
+            matches = hits[hits['dt'].between(start_ts, end_ts)]
+            num_matches = len(matches)
+            view = matches[columns].head(100)
+        else:
+            num_matches = num_filtered
+            in_range = np.flatnonzero(df['dt'].between(start_ts, end_ts).to_numpy())
+            view = df.iloc[in_range[:100]][columns]
         
         st.dataframe(
-            display_df[['title', 'date_parsed', 'url']].head(100),
+            view,
             use_container_width=True,
             height=400
         )
         
-        st.info(f"Showing first 100 of {len(display_df):,} articles")
+        st.info(f"Showing first 100 of {num_matches:,} articles")
         
     else:
         st.warning("⚠️ No articles with valid dates found in this dataset.")
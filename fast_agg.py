@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Fast aggregation helpers for Q2BSTUDIO Auditor
+
+Counting kernels used on large checkpoints. When numba is installed the
+kernels are JIT-compiled (and cached on disk, so the compile cost is paid
+once); otherwise equivalent NumPy implementations are used.
+
+Install the accelerated version with:
+    pip install q2bs-auditor[fast]
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _day_counts(days, n_days):
+        out = np.zeros(n_days, np.int64)
+        for d in days:
+            out[d] += 1
+        return out
+
+else:
+
+    def _day_counts(days, n_days):
+        return np.bincount(days, minlength=n_days).astype(np.int64)
+
+
+def day_counts(days: np.ndarray, n_days: int) -> np.ndarray:
+    """
+    Count occurrences of each day index.
+
+    Args:
+        days: int64 array of day offsets in the range [0, n_days)
+        n_days: Number of days covered
+
+    Returns:
+        int64 array of length n_days with the count for each day
+    """
+    return _day_counts(np.ascontiguousarray(days, dtype=np.int64), n_days)
@@ -1,17 +1,29 @@
 import os
+import numpy as np
+import pandas as pd
+import matplotlib
+
+# Graphs are only ever written to files; never initialise a GUI backend
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-from datetime import datetime as dt, timedelta
 from typing import Optional, Dict, Any
 
+# Name of the matplotlib style applied to this process, so it is only
+# parsed and applied once rather than on every create_visualizations call
+_STYLE_LOADED: Optional[str] = None
+
 # Constants
 UNKNOWN_DATE = "UNKNOWN_DATE"
 
 
 class Q2BDataVisualizer:
-    def __init__(self, input_dir, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, input_dir, config: Optional[Dict[str, Any]] = None, fast: bool = False):
         self.input_dir = input_dir
         self.config = config or self._get_default_config()
+        # fast renders at output.screen_dpi instead of the archival output.dpi
+        self.fast = fast
 
     def _get_default_config(self) -> Dict[str, Any]:
         """Return default configuration if no Hydra config provided."""
@@ -81,6 +93,7 @@ class Q2BDataVisualizer:
             "output": {
                 "graphs_dir": "graphs",
                 "dpi": 300,
+                "screen_dpi": 150,
                 "bbox_inches": "tight"
             },
             "style": {
@@ -94,7 +107,11 @@ class Q2BDataVisualizer:
         graphs_dir = os.path.join(self.input_dir, self.config["output"]["graphs_dir"])
         os.makedirs(graphs_dir, exist_ok=True)
 
-        plt.style.use(self.config["style"]["theme"])
+        global _STYLE_LOADED
+        theme = self.config["style"]["theme"]
+        if _STYLE_LOADED != theme:
+            plt.style.use(theme)
+            _STYLE_LOADED = theme
         
         # Extract colors from config
         color_cfg = self.config["visualization"]["colors"]
@@ -112,6 +129,20 @@ class Q2BDataVisualizer:
 
         print(f"Graphs saved in: {graphs_dir}")
 
+    def _save_figure(self, output_dir, filename):
+        """Save and close the current figure.
+
+        Fast renders use the lower screen DPI instead of the archival one.
+        """
+        output_cfg = self.config["output"]
+        dpi = output_cfg.get("screen_dpi", 150) if self.fast else output_cfg["dpi"]
+        plt.savefig(
+            os.path.join(output_dir, filename),
+            dpi=dpi,
+            bbox_inches=output_cfg["bbox_inches"],
+        )
+        plt.close()
+
     def plot_daily_articles(self, report, output_dir, colors):
         daily_data = report["daily_statistics"]["articles_per_day"]
 
@@ -124,40 +155,31 @@ class Q2BDataVisualizer:
         chart_cfg = viz_cfg["chart_settings"]
         color_cfg = viz_cfg["colors"]
         
-        _, ax = plt.subplots(figsize=(dims["width"], dims["height"]))
+        _, ax = plt.subplots(figsize=(dims["width"], dims["height"]), constrained_layout=True)
 
-        dates = list(daily_data.keys())
-        counts = list(daily_data.values())
+        # Date keys are ISO dates or UNKNOWN_DATE, the longest possible key
+        num_days = len(daily_data)
+        dates = np.fromiter(daily_data.keys(), dtype=f"U{len(UNKNOWN_DATE)}", count=num_days)
+        counts = np.fromiter(daily_data.values(), dtype=np.int64, count=num_days)
+        peak_idx = int(counts.argmax())
 
         earliest = report["date_range"]["earliest"]
         latest = report["date_range"]["latest"]
 
-        bar_colors = []
-        for date in dates:
-            if date == earliest or date == latest:
-                bar_colors.append(color_cfg["partial_day"])
-            elif date == max(daily_data, key=daily_data.get):
-                bar_colors.append(colors[1])
-            else:
-                bar_colors.append(colors[0])
-
-        ax.bar(
-            dates, counts, color=bar_colors, 
+        # Partial (first/last) days take precedence over the peak highlight
+        bar_colors = np.full(num_days, colors[0], dtype=object)
+        bar_colors[peak_idx] = colors[1]
+        bar_colors[np.isin(dates, [earliest, latest])] = color_cfg["partial_day"]
+
+        bars = ax.bar(
+            dates, counts, color=bar_colors.tolist(), 
             alpha=chart_cfg["bar_alpha"], 
             edgecolor="black", 
-            linewidth=chart_cfg["bar_edge_width"]
+            linewidth=chart_cfg["bar_edge_width"],
+            rasterized=True,
         )
 
-        num_days = len(dates)
-
-        important_indices = set()
-
-        peak_date = max(daily_data, key=daily_data.get)
-        if peak_date in dates:
-            important_indices.add(dates.index(peak_date))
-
-        important_indices.add(0)
-        important_indices.add(len(dates) - 1)
+        important_indices = {peak_idx, 0, num_days - 1}
 
         # Use label configuration
         label_cfg = viz_cfg["labels"]
@@ -179,24 +201,18 @@ class Q2BDataVisualizer:
             indices_to_show = important_indices
             font_size = fonts_cfg["tick_medium"]
 
-        for i, (date, count) in enumerate(zip(dates, counts)):
-            if i in indices_to_show:
-                label = f"{count:,}"
-                if date == earliest or date == latest:
-                    label += "\n(partial)"
-
-                if num_days > label_cfg["max_days_tenth_labels"] and i in important_indices:
-                    label = f"{date}\n{label}"
-
-                ax.text(
-                    i,
-                    count + max(counts) * 0.02,
-                    label,
-                    ha="center",
-                    va="bottom",
-                    fontsize=font_size,
-                    fontweight="bold",
-                )
+        labels = [""] * num_days
+        for i in indices_to_show:
+            label = f"{counts[i]:,}"
+            if dates[i] == earliest or dates[i] == latest:
+                label += "\n(partial)"
+
+            if num_days > label_cfg["max_days_tenth_labels"] and i in important_indices:
+                label = f"{dates[i]}\n{label}"
+
+            labels[i] = label
+
+        ax.bar_label(bars, labels=labels, padding=3, fontsize=font_size, fontweight="bold")
 
         avg = report["daily_statistics"]["average_per_day"]
         ax.axhline(
@@ -248,14 +264,7 @@ class Q2BDataVisualizer:
             tick_labels = [dates[i] if i < len(dates) else "" for i in tick_positions]
             plt.xticks(tick_positions, tick_labels, rotation=45, ha="right")
 
-        plt.tight_layout()
-        output_cfg = self.config["output"]
-        plt.savefig(
-            os.path.join(output_dir, "1_daily_articles.png"),
-            dpi=output_cfg["dpi"],
-            bbox_inches=output_cfg["bbox_inches"],
-        )
-        plt.close()
+        self._save_figure(output_dir, "1_daily_articles.png")
 
         print("Created: 1_daily_articles.png")
 
@@ -270,7 +279,7 @@ class Q2BDataVisualizer:
         dims = viz_cfg["dimensions"]["timeline"]
         chart_cfg = viz_cfg["chart_settings"]
         
-        _, ax = plt.subplots(figsize=(dims["width"], dims["height"]))
+        _, ax = plt.subplots(figsize=(dims["width"], dims["height"]), constrained_layout=True)
 
         dates_str = list(daily_data.keys())
 
@@ -282,9 +291,12 @@ class Q2BDataVisualizer:
             return
 
         valid_dates_str.sort()
+        pos = {d: i for i, d in enumerate(valid_dates_str)}
 
-        dates = [dt.strptime(d, "%Y-%m-%d") for d in valid_dates_str]
-        counts = [daily_data[d_str] for d_str in valid_dates_str]
+        dates = np.array(valid_dates_str, dtype="datetime64[D]")
+        counts = np.fromiter(
+            (daily_data[d_str] for d_str in valid_dates_str), dtype=np.int64, count=len(dates)
+        )
 
         earliest = report["date_range"]["earliest"]
         latest = report["date_range"]["latest"]
@@ -301,12 +313,12 @@ class Q2BDataVisualizer:
             markeredgewidth=chart_cfg["marker_edge_width"],
         )
 
-        ax.fill_between(dates, counts, alpha=0.3, color=colors[3])
+        ax.fill_between(dates, counts, alpha=0.3, color=colors[3], rasterized=True)
 
         dates_calc = [d for d in valid_dates_str if d != earliest and d != latest]
         if dates_calc:
             peak_date_str = max(dates_calc, key=lambda d: daily_data[d])
-            max_idx = valid_dates_str.index(peak_date_str)
+            max_idx = pos[peak_date_str]
 
             ax.plot(
                 dates[max_idx],
@@ -319,7 +331,7 @@ class Q2BDataVisualizer:
                 markeredgewidth=chart_cfg["marker_edge_width"],
             )
 
-        num_days = (dates[-1] - dates[0]).days if dates else 0
+        num_days = int((dates[-1] - dates[0]).astype(int))
 
         # Use date format configuration
         date_fmt_cfg = viz_cfg["timeline"]["date_format"]
@@ -363,14 +375,7 @@ class Q2BDataVisualizer:
         else:
             plt.xticks(rotation=0)
 
-        plt.tight_layout()
-        output_cfg = self.config["output"]
-        plt.savefig(
-            os.path.join(output_dir, "2_timeline.png"), 
-            dpi=output_cfg["dpi"], 
-            bbox_inches=output_cfg["bbox_inches"]
-        )
-        plt.close()
+        self._save_figure(output_dir, "2_timeline.png")
 
         print("Created: 2_timeline.png")
 
@@ -384,39 +389,29 @@ class Q2BDataVisualizer:
         daily_data = report["daily_statistics"]["articles_per_day"]
         valid_data = {k: v for k, v in daily_data.items() if k != UNKNOWN_DATE}
 
-        last_4_weeks_data = {}
-        last_4_weeks_total = 0
-        last_4_weeks_peak = 0
-
+        last_4_weeks = pd.Series(dtype="int64")
         if valid_data:
-            try:
-                latest_date_str = max(valid_data.keys())
-                latest_date = dt.strptime(latest_date_str, "%Y-%m-%d")
-                four_weeks_ago = latest_date - timedelta(days=28)
-
-                for date_str, count in valid_data.items():
-                    date_obj = dt.strptime(date_str, "%Y-%m-%d")
-                    if date_obj >= four_weeks_ago:
-                        last_4_weeks_data[date_str] = count
-                        last_4_weeks_total += count
-                        if count > last_4_weeks_peak:
-                            last_4_weeks_peak = count
-            except:
-                last_4_weeks_data = valid_data
-                last_4_weeks_total = sum(valid_data.values())
-                last_4_weeks_peak = max(valid_data.values()) if valid_data else 0
-
-        num_days = len(last_4_weeks_data)
+            daily = pd.Series(valid_data)
+            daily.index = pd.to_datetime(daily.index, format="%Y-%m-%d", errors="coerce", cache=True)
+            daily = daily[daily.index.notna()].sort_index()
+            if not daily.empty:
+                last_4_weeks = daily.loc[daily.index.max() - pd.Timedelta(days=28):]
+
+        num_days = len(last_4_weeks)
+        last_4_weeks_total = int(last_4_weeks.sum())
+        last_4_weeks_peak = int(last_4_weeks.max()) if num_days > 0 else 0
         last_4_weeks_avg = last_4_weeks_total / num_days if num_days > 0 else 0
 
-        if last_4_weeks_data:
-            earliest_4w = min(last_4_weeks_data.keys())
-            latest_4w = max(last_4_weeks_data.keys())
-            date_range_4w = f"{earliest_4w} to {latest_4w}"
+        if num_days > 0:
+            date_range_4w = f"{last_4_weeks.index[0]:%Y-%m-%d} to {last_4_weeks.index[-1]:%Y-%m-%d}"
         else:
             date_range_4w = "No data"
 
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(dims["width"], dims["height"]))
+        # Only the comparison chart needs axes; the three headline metrics are
+        # plain figure text placed in the remaining cells of a 2x2 grid
+        fig = plt.figure(figsize=(dims["width"], dims["height"]), constrained_layout=True)
+        grid = fig.add_gridspec(2, 2)
+        ax4 = fig.add_subplot(grid[1, 1])
 
         fig.suptitle(
             f"Q2BSTUDIO Content Farm: Statistical Analysis (Last 4 Weeks)\nPeriod: {date_range_4w}",
@@ -425,93 +420,34 @@ class Q2BDataVisualizer:
             y=0.98,
         )
 
-        ax1.text(
-            0.5,
-            0.6,
-            f"{last_4_weeks_total:,}",
-            ha=stats_cfg["text_ha"],
-            va=stats_cfg["text_va"],
-            fontsize=fonts_cfg["annotation_large"],
-            fontweight="bold",
-            color=colors[0],
-        )
-        ax1.text(
-            0.5,
-            0.35,
-            "Articles Published\n(Last 4 Weeks)",
-            ha=stats_cfg["text_ha"],
-            va=stats_cfg["text_va"],
-            fontsize=fonts_cfg["annotation_small"],
-            fontweight="bold",
-        )
-        ax1.axis("off")
-        ax1.set_facecolor(stats_cfg["background_color"])
-
-        ax2.text(
-            0.5,
-            0.6,
-            f"{last_4_weeks_avg:,.0f}",
-            ha=stats_cfg["text_ha"],
-            va=stats_cfg["text_va"],
-            fontsize=fonts_cfg["annotation_large"],
-            fontweight="bold",
-            color=colors[1],
-        )
-        ax2.text(
-            0.5,
-            0.35,
-            "Articles Per Day\n(Last 4 Weeks Avg)",
-            ha=stats_cfg["text_ha"],
-            va=stats_cfg["text_va"],
-            fontsize=fonts_cfg["annotation_small"],
-            fontweight="bold",
-        )
+        def cell_text(cell, y, text, fontsize, **kwargs):
+            box = cell.get_position(fig)
+            fig.text(
+                box.x0 + 0.5 * box.width,
+                box.y0 + y * box.height,
+                text,
+                ha=stats_cfg["text_ha"],
+                va=stats_cfg["text_va"],
+                fontsize=fontsize,
+                fontweight="bold",
+                **kwargs,
+            )
+
         seconds = 86400 / last_4_weeks_avg if last_4_weeks_avg > 0 else 0
-        ax2.text(
-            0.5,
-            0.15,
-            f"1 article every {seconds:.1f} seconds",
-            ha=stats_cfg["text_ha"],
-            va=stats_cfg["text_va"],
-            fontsize=fonts_cfg["annotation_medium"],
-            color="red",
-            fontweight="bold",
-        )
-        ax2.axis("off")
-        ax2.set_facecolor(stats_cfg["background_color"])
-
-        ax3.text(
-            0.5,
-            0.6,
-            f"{last_4_weeks_peak:,}",
-            ha=stats_cfg["text_ha"],
-            va=stats_cfg["text_va"],
-            fontsize=fonts_cfg["annotation_large"],
-            fontweight="bold",
-            color=colors[2],
-        )
-        ax3.text(
-            0.5,
-            0.35,
-            "Peak Day\n(Last 4 Weeks Max)",
-            ha=stats_cfg["text_ha"],
-            va=stats_cfg["text_va"],
-            fontsize=fonts_cfg["annotation_small"],
-            fontweight="bold",
-        )
         peak_seconds = 86400 / last_4_weeks_peak if last_4_weeks_peak > 0 else 0
-        ax3.text(
-            0.5,
-            0.15,
-            f"1 article every {peak_seconds:.1f} seconds",
-            ha=stats_cfg["text_ha"],
-            va=stats_cfg["text_va"],
-            fontsize=fonts_cfg["annotation_medium"],
-            fontweight="bold",
-            color="red",
-        )
-        ax3.axis("off")
-        ax3.set_facecolor(stats_cfg["background_color"])
+        metrics = [
+            (grid[0, 0], f"{last_4_weeks_total:,}", colors[0],
+             "Articles Published\n(Last 4 Weeks)", None),
+            (grid[0, 1], f"{last_4_weeks_avg:,.0f}", colors[1],
+             "Articles Per Day\n(Last 4 Weeks Avg)", f"1 article every {seconds:.1f} seconds"),
+            (grid[1, 0], f"{last_4_weeks_peak:,}", colors[2],
+             "Peak Day\n(Last 4 Weeks Max)", f"1 article every {peak_seconds:.1f} seconds"),
+        ]
+        for cell, value, color, caption, rate in metrics:
+            cell_text(cell, 0.6, value, fonts_cfg["annotation_large"], color=color)
+            cell_text(cell, 0.35, caption, fonts_cfg["annotation_small"])
+            if rate:
+                cell_text(cell, 0.15, rate, fonts_cfg["annotation_medium"], color="red")
 
         # Build comparisons from config
         comparisons = [(src["name"], src["articles_per_day"]) for src in stats_cfg["comparison_sources"]]
@@ -553,13 +489,7 @@ class Q2BDataVisualizer:
         )
         ax4.grid(True, alpha=chart_cfg["grid_alpha"], axis="x")
 
-        plt.tight_layout()
-        output_cfg = self.config["output"]
-        plt.savefig(
-            os.path.join(output_dir, "3_stats_summary.png"),
-            dpi=output_cfg["dpi"],
-            bbox_inches=output_cfg["bbox_inches"],
-        )
-        plt.close()
+        with plt.rc_context({"path.simplify": True, "path.simplify_threshold": 1.0}):
+            self._save_figure(output_dir, "3_stats_summary.png")
 
         print("Created: 3_stats_summary.png")
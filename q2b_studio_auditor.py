@@ -1,25 +1,373 @@
-import time
+import asyncio
+import aiohttp
+import random
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import threading
+import time
+import zlib
+from lxml import etree
 import csv
-from datetime import datetime
-import json
+from datetime import date, datetime
+import orjson
 import os
-from collections import defaultdict
-import locale
+import re
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from urllib.parse import urlparse
+from urllib3.util.retry import Retry
 
 try:
-    locale.setlocale(locale.LC_TIME, "es_ES.UTF-8")
-except:
-    try:
-        locale.setlocale(locale.LC_TIME, "Spanish_Spain.1252")
-    except:
-        print("Warning: Could not set Spanish locale")
+    import brotli  # lets requests and decompress_body decode br bodies
+
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    brotli = None
+    ACCEPT_ENCODING = "gzip, deflate"
 
 # Constants
 UNKNOWN_DATE = "UNKNOWN_DATE"
 NA_VALUE = "N/A"
+# Listing pages fetched in parallel by scrape_all_pages
+MAX_CONCURRENT_REQUESTS = 16
+# Starting request rate towards the site, in requests per second; adapted at
+# runtime between the MIN and MAX bounds from the server's responses
+REQUESTS_PER_SECOND = 8
+MIN_REQUESTS_PER_SECOND = 1
+MAX_REQUESTS_PER_SECOND = 32
+# Attempts made per page before giving up on it
+MAX_RETRIES = 4
+MAX_BACKOFF_SECONDS = 30
+CHECKPOINT_BUFFER_SIZE = 1024 * 1024
+# Bytes handed to the listing parser at a time while a response streams in
+STREAM_CHUNK_SIZE = 16 * 1024
+ARTICLE_FIELDS = ["url", "title", "date_raw", "date_parsed", "page_num", "archive_url"]
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Responses that mean the server wants us to slow down
+THROTTLE_STATUSES = {429, 503}
+
+# Spanish month names, so dates parse without depending on the system locale
+_SPANISH_MONTHS = {
+    "enero": 1,
+    "febrero": 2,
+    "marzo": 3,
+    "abril": 4,
+    "mayo": 5,
+    "junio": 6,
+    "julio": 7,
+    "agosto": 8,
+    "septiembre": 9,
+    "setiembre": 9,
+    "octubre": 10,
+    "noviembre": 11,
+    "diciembre": 12,
+}
+_DATE_RE = re.compile(
+    r"(\d{1,2})\s+de\s+([a-záéíóú]+)\s+de\s+(\d{4})", re.IGNORECASE
+)
+
+
+# Article URLs look like https://www.q2bstudio.com/nuestro-blog/<id>/<slug>
+_ARTICLE_ID_RE = re.compile(r"/nuestro-blog/(\d+)(?:/|$)")
+
+
+def _has_class(name):
+    """XPath predicate equivalent to the CSS class selector ``.name``."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Listing page XPaths, compiled once and evaluated by libxml2
+PAGINATION_LABEL = "Page navigation example"
+_PAGE_LINKS_XPATH = etree.XPath(f".//a[{_has_class('page-link')}]/@href")
+_LINK_XPATH = etree.XPath("(.//a/@href)[1]", smart_strings=False)
+# string() yields "" for a missing element, which fails validation like N/A
+_TITLE_XPATH = etree.XPath(
+    f"string((.//div[{_has_class('title')}])[1])", smart_strings=False
+)
+_DATE_XPATH = etree.XPath(
+    f"string((.//div[{_has_class('tags')}]//div[{_has_class('inner')}])[1])",
+    smart_strings=False,
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_spanish_date(date_str):
+    """Convert e.g. "lunes, 20 de enero de 2025" to "2025-01-20".
+
+    Dates repeat across every article published the same day, hence the cache.
+    """
+    if not date_str or date_str == NA_VALUE:
+        return UNKNOWN_DATE
+
+    # Remove day of week if present (e.g., "lunes, 20 de enero de 2025")
+    date_parts = date_str.split(",", 1)
+    clean_date = date_parts[1] if len(date_parts) > 1 else date_str
+
+    match = _DATE_RE.search(clean_date)
+    if not match:
+        return UNKNOWN_DATE
+
+    month = _SPANISH_MONTHS.get(match[2].lower())
+    if month is None:
+        return UNKNOWN_DATE
+
+    try:
+        # Rejects impossible dates such as "31 de febrero"
+        return date(int(match[3]), month, int(match[1])).isoformat()
+    except ValueError:
+        return UNKNOWN_DATE
+
+
+def decompress_body(body, content_encoding):
+    """Undo a response's Content-Encoding (gzip, deflate and, if available, br)."""
+    codings = [c.strip().lower() for c in (content_encoding or "").split(",")]
+    # Codings are listed in the order they were applied
+    for coding in reversed(codings):
+        if coding in ("gzip", "x-gzip"):
+            body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        elif coding == "deflate":
+            try:
+                body = zlib.decompress(body)
+            except zlib.error:
+                # Some servers send a raw deflate stream without zlib headers
+                body = zlib.decompress(body, -zlib.MAX_WBITS)
+        elif coding == "br" and brotli is not None:
+            body = brotli.decompress(body)
+        elif coding not in ("", "identity"):
+            raise ValueError(f"Unsupported Content-Encoding: {coding}")
+    return body
+
+
+def iter_listing_items(content):
+    """Yield each div.item-new of a listing page as soon as it has been parsed.
+
+    content is either the whole body or an iterable of byte chunks, such as a
+    response that is still downloading. The page is read with a pull parser
+    rather than built into a full DOM up front. Each item is cleared, along
+    with the items before it, once the caller moves on, so memory stays flat
+    regardless of page size.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="div", encoding="utf-8")
+
+    def drain():
+        for _, elem in parser.read_events():
+            if "item-new" not in (elem.get("class") or "").split():
+                continue
+            yield elem
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    if isinstance(content, (bytes, bytearray)):
+        content = (content,)
+    for chunk in content:
+        parser.feed(chunk)
+        yield from drain()
+    parser.close()
+    yield from drain()
+
+
+def find_pagination_links(content):
+    """Return the page-link hrefs of the listing's pagination nav, or None.
+
+    The pull parser only reports <nav> elements, and reading stops at the
+    pagination nav, so when content is a stream of chunks the rest of the page
+    is never downloaded.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="nav", encoding="utf-8")
+
+    def pagination():
+        for _, nav in parser.read_events():
+            if nav.get("aria-label") == PAGINATION_LABEL:
+                return nav
+        return None
+
+    if isinstance(content, (bytes, bytearray)):
+        content = (content,)
+    for chunk in content:
+        parser.feed(chunk)
+        nav = pagination()
+        if nav is not None:
+            return _PAGE_LINKS_XPATH(nav)
+    parser.close()
+    nav = pagination()
+    return None if nav is None else _PAGE_LINKS_XPATH(nav)
+
+
+class RetryableHTTPError(Exception):
+    """Raised for HTTP responses worth retrying (rate limiting, server errors)."""
+
+    def __init__(self, status, retry_after=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value):
+    """Return the delay in seconds requested by a Retry-After header, if any."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Token bucket limiting how many requests start per second.
+
+    Shared by the asyncio path (``async with limiter:``) and the thread pool
+    path (``limiter.wait()``). Up to ``burst`` requests may start back to back,
+    after which they are spaced to ``rate`` per second.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        # Caller holds self._lock
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self):
+        """Take a token and return how long to wait before it may be used."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def on_response(self, status, headers):
+        """Feedback hook called with every response; a fixed rate ignores it."""
+
+    def wait(self):
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def __aenter__(self):
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def advertised_rate(headers):
+    """Requests per second allowed by X-RateLimit-Remaining / X-RateLimit-Reset."""
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None:
+        return None
+    try:
+        remaining = float(remaining)
+        reset = float(reset)
+    except ValueError:
+        return None
+    # Servers send either the seconds left in the window or an epoch timestamp
+    if reset > 1e9:
+        reset -= time.time()
+    return remaining / max(reset, 1.0)
+
+
+class AdaptiveLimiter(RateLimiter):
+    """RateLimiter that tracks the server's tolerance (AIMD).
+
+    The rate rises by ``increase_step`` after every ``increase_after``
+    consecutive successful responses and is multiplied by ``decrease_factor``
+    on 429/503, at most once per ``decrease_interval`` seconds so that a burst
+    of throttled requests already in flight only counts once. When the server
+    advertises its budget through X-RateLimit-* headers, the rate follows that
+    instead.
+    """
+
+    def __init__(
+        self,
+        rate,
+        min_rate=MIN_REQUESTS_PER_SECOND,
+        max_rate=MAX_REQUESTS_PER_SECOND,
+        increase_step=0.5,
+        increase_after=10,
+        decrease_factor=0.5,
+        decrease_interval=5.0,
+    ):
+        super().__init__(rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.increase_after = increase_after
+        self.decrease_factor = decrease_factor
+        self.decrease_interval = decrease_interval
+        self._successes = 0
+        self._last_decrease = float("-inf")
+
+    def _set_rate(self, rate):
+        # Caller holds self._lock; settle the tokens earned at the old rate first
+        self._refill()
+        self.rate = min(self.max_rate, max(self.min_rate, rate))
+
+    def on_response(self, status, headers):
+        with self._lock:
+            if status in THROTTLE_STATUSES:
+                self._successes = 0
+                now = time.monotonic()
+                if now - self._last_decrease < self.decrease_interval:
+                    return
+                self._last_decrease = now
+                self._set_rate(self.rate * self.decrease_factor)
+                print(
+                    f"Server throttled (HTTP {status}), "
+                    f"rate lowered to {self.rate:.2f}/s"
+                )
+                return
+            if status >= 400:
+                return
+
+            allowed = advertised_rate(headers)
+            if allowed is not None:
+                self._set_rate(allowed)
+                return
+
+            self._successes += 1
+            if self._successes >= self.increase_after:
+                self._successes = 0
+                self._set_rate(self.rate + self.increase_step)
+
+
+class PageOrderBuffer:
+    """Hands back completed pages' articles in scrape order.
+
+    Concurrent fetches finish in any order. A page's articles are released
+    only once every earlier page has completed, so a checkpoint never holds
+    a later page while an earlier one is missing; calculate_resume_page
+    resumes after the oldest saved article and would skip such a gap.
+    """
+
+    def __init__(self, page_nums):
+        self._order = deque(page_nums)
+        self._completed = {}
+
+    def complete(self, page_num, articles):
+        """Record a finished page; return the articles now released, in page order."""
+        self._completed[page_num] = articles
+        released = []
+        while self._order and self._order[0] in self._completed:
+            released.extend(self._completed.pop(self._order.popleft()))
+        return released
 
 
 class Q2BStudioAuditor:
@@ -27,11 +375,30 @@ class Q2BStudioAuditor:
         self.base_url = "https://www.q2bstudio.com"
         self.blog_url = f"{self.base_url}/blog-empresa-aplicaciones"
         self.session = requests.Session()
+        # Keep up to MAX_CONCURRENT_REQUESTS sockets alive per host and let
+        # urllib3 retry transient failures. Throttling responses (429/503)
+        # are retried by _get_with_retry instead, so they reach the rate
+        # limiter and every retry is paced by it
+        adapter = HTTPAdapter(
+            pool_connections=MAX_CONCURRENT_REQUESTS,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            max_retries=Retry(
+                total=MAX_RETRIES,
+                backoff_factor=0.5,
+                status_forcelist=RETRY_STATUSES - THROTTLE_STATUSES,
+                respect_retry_after_header=False,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+                "Accept-Encoding": ACCEPT_ENCODING,
                 "Accept-Language": "es-ES,es;q=0.9,en;q=0.8",
+                "Connection": "keep-alive",
                 "Referer": "https://www.google.com/",
                 "DNT": "1",
             }
@@ -39,6 +406,15 @@ class Q2BStudioAuditor:
         self.articles = {}
         self.articles_by_date = defaultdict(list)
         self.validation_errors = 0
+        # Articles per date_parsed, kept in step with self.articles so reports
+        # never need a pass over every article
+        self._daily_counts = Counter()
+        # Newly seen articles not yet appended to articles.jsonl / articles.csv
+        self._pending_articles = []
+        # Set when the files on disk do not mirror self.articles (fresh run or
+        # a legacy checkpoint), so the next save rewrites them in full
+        self._needs_full_save = True
+        self._max_page = None
 
         if create_output_dir:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -70,8 +446,12 @@ class Q2BStudioAuditor:
         except Exception:
             return False
 
-    def validate_article_data(self, article_data):
-        """Validate that article data contains all required fields and is properly formatted."""
+    def validate_article_data(self, article_data, url_already_validated=False):
+        """Validate that article data contains all required fields and is properly formatted.
+
+        Pass url_already_validated=True when the caller has just checked the URL
+        itself, to skip parsing it a second time.
+        """
         if not isinstance(article_data, dict):
             return False
         
@@ -82,7 +462,7 @@ class Q2BStudioAuditor:
                 return False
         
         # Validate URL
-        if not self.validate_url(article_data["url"]):
+        if not url_already_validated and not self.validate_url(article_data["url"]):
             return False
         
         # Validate title is not empty
@@ -95,23 +475,29 @@ class Q2BStudioAuditor:
         
         return True
 
-    def get_max_page_number(self):
+    def get_max_page_number(self, refresh=False):
+        """Return the number of listing pages, or None if it cannot be determined.
+
+        The first successful lookup is remembered for the lifetime of the
+        auditor; pass refresh=True to query the site again.
+        """
+        if self._max_page is not None and not refresh:
+            return self._max_page
+
         print("\nGetting maximum page number...")
 
         try:
-            response = self.session.get(self.blog_url, timeout=15)
-            soup = BeautifulSoup(response.content, "html.parser")
+            with self._get_with_retry(self.blog_url) as response:
+                page_links = find_pagination_links(
+                    response.iter_content(STREAM_CHUNK_SIZE)
+                )
 
-            pagination = soup.find("nav", {"aria-label": "Page navigation example"})
-            if not pagination:
+            if page_links is None:
                 print("Could not find pagination")
                 return None
 
-            page_links = pagination.find_all("a", class_="page-link")
-
             max_page = 1
-            for link in page_links:
-                href = link.get("href", "")
+            for href in page_links:
                 if "/page/" in href:
                     try:
                         page_num = int(href.split("/page/")[-1])
@@ -121,6 +507,7 @@ class Q2BStudioAuditor:
                         continue
 
             print(f"Maximum page number: {max_page:,}")
+            self._max_page = max_page
             return max_page
 
         except Exception as e:
@@ -129,171 +516,361 @@ class Q2BStudioAuditor:
 
     def parse_spanish_date(self, date_str: str):
         """Parse Spanish-format date strings with improved validation."""
-        if not date_str or date_str == NA_VALUE:
-            return UNKNOWN_DATE
-        
-        try:
-            # Remove day of week if present (e.g., "lunes, 20 de enero de 2025")
-            date_parts = date_str.split(",", 1)
-            if len(date_parts) > 1:
-                clean_date = date_parts[1].strip()
-            else:
-                clean_date = date_str.strip()
-            
-            # Validate the date format before parsing
-            if "de" not in clean_date:
-                return UNKNOWN_DATE
-            
-            date_obj = datetime.strptime(clean_date, "%d de %B de %Y")
-            return date_obj.strftime("%Y-%m-%d")
-        except ValueError:
-            # Specific error for date parsing
-            return UNKNOWN_DATE
-        except Exception:
-            # Catch any other unexpected errors
-            return UNKNOWN_DATE
+        return _parse_spanish_date(date_str)
 
-    def scrape_page(self, page_num):
-        """Scrape a single page with improved validation."""
-        url = f"{self.blog_url}/page/{page_num}" if page_num > 1 else self.blog_url
-        articles_on_page = []
+    def page_url(self, page_num):
+        return f"{self.blog_url}/page/{page_num}" if page_num > 1 else self.blog_url
 
-        try:
-            response = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, "html.parser")
-            article_items = soup.find_all("div", class_="item-new")
+    def parse_page(self, content, page_num, seen_urls=None):
+        """Extract validated articles from a listing page's HTML.
 
-            for item in article_items:
-                try:
-                    link_elem = item.find("a", href=True)
-                    if not link_elem:
-                        continue
-
-                    article_url = self.base_url + link_elem["href"]
-                    
-                    # Validate URL before proceeding
-                    if not self.validate_url(article_url):
-                        self.validation_errors += 1
-                        continue
-                    
-                    title_elem = item.find("div", class_="title")
-                    title = title_elem.get_text().strip() if title_elem else NA_VALUE
-                    
-                    tags_elem = item.find("div", class_="tags")
-                    date_str = NA_VALUE
-                    if tags_elem:
-                        inner = tags_elem.find("div", class_="inner")
-                        if inner:
-                            text = inner.get_text().strip()
-                            if "|" in text:
-                                date_str = text.split("|")[1].strip()
-
-                    parsed_date = self.parse_spanish_date(date_str)
-
-                    article_data = {
-                        "url": article_url,
-                        "title": title,
-                        "date_raw": date_str,
-                        "date_parsed": parsed_date,
-                        "page_num": page_num,
-                    }
-
-                    # Validate article data before adding
-                    if self.validate_article_data(article_data):
-                        articles_on_page.append(article_data)
-                    else:
-                        self.validation_errors += 1
+        Items whose URL is in seen_urls are skipped before any further field
+        extraction or validation. Returns a tuple of (articles,
+        validation_errors) instead of touching self.validation_errors, so it
+        can safely run in a worker thread.
+        """
+        articles_on_page = []
+        errors = 0
+        if seen_urls is None:
+            seen_urls = ()
+        site_prefix = self.base_url + "/"
+
+        for item in iter_listing_items(content):
+            try:
+                href = _LINK_XPATH(item)
+                if not href:
+                    continue
 
-                except Exception:
-                    # Skip articles that fail to parse
-                    self.validation_errors += 1
+                article_url = self.base_url + href[0]
+                if article_url in seen_urls:
                     continue
+                
+                # base_url + href stays on the site exactly when href is a
+                # root-relative path, so a prefix test replaces validate_url here
+                if not article_url.startswith(site_prefix):
+                    errors += 1
+                    continue
+                
+                title = _TITLE_XPATH(item).strip()
+                
+                date_str = NA_VALUE
+                text = _DATE_XPATH(item).strip()
+                if "|" in text:
+                    date_str = text.split("|")[1].strip()
+
+                parsed_date = self.parse_spanish_date(date_str)
+
+                article_data = {
+                    "url": article_url,
+                    "title": title,
+                    "date_raw": date_str,
+                    "date_parsed": parsed_date,
+                    "page_num": page_num,
+                }
+
+                # Validate article data before adding
+                if self.validate_article_data(article_data, url_already_validated=True):
+                    articles_on_page.append(article_data)
+                else:
+                    errors += 1
+
+            except Exception:
+                # Skip articles that fail to parse
+                errors += 1
+                continue
+
+        return articles_on_page, errors
+
+    @contextmanager
+    def _get_with_retry(self, url, limiter=None):
+        """Stream a GET with the requests session, retrying throttling responses.
+
+        429/503 responses are reported to the limiter and retried up to
+        MAX_RETRIES times, after Retry-After (or exponential backoff) and
+        another limiter.wait(), like fetch_with_retry on the asyncio path.
+        Yields the last response.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            if limiter is not None:
+                limiter.wait()
+            with self.session.get(url, timeout=15, stream=True) as response:
+                if limiter is not None:
+                    limiter.on_response(response.status_code, response.headers)
+                if response.status_code not in THROTTLE_STATUSES or attempt == MAX_RETRIES:
+                    yield response
+                    return
+                status = response.status_code
+                delay = parse_retry_after(response.headers.get("Retry-After"))
+
+            if delay is None:
+                delay = min(2**attempt, MAX_BACKOFF_SECONDS) + random.random()
+            print(f"Retrying {url} in {delay:.1f}s (HTTP {status})")
+            time.sleep(delay)
+
+    def _fetch_and_parse(self, page_num, limiter=None):
+        """Fetch a page with the requests session; returns (articles, validation_errors).
+
+        The body is streamed into the parser chunk by chunk, so parsing (and
+        decompression) overlap with the download in the calling worker thread.
+        """
+        with self._get_with_retry(self.page_url(page_num), limiter) as response:
+            return self.parse_page(
+                response.iter_content(STREAM_CHUNK_SIZE),
+                page_num,
+                seen_urls=self.articles,
+            )
 
+    def scrape_page(self, page_num):
+        """Scrape a single page with improved validation."""
+        try:
+            articles_on_page, errors = self._fetch_and_parse(page_num)
+            self.validation_errors += errors
             return articles_on_page
 
         except Exception as e:
             print(f"Error scraping page {page_num}: {e}")
             return []
 
-    def scrape_all_pages(self, max_page, start_page=1, sample_every=1):
-        print(f"\nStarting scraping...")
-        print(f"Pages to scrape: {start_page} to {max_page}")
-        print(f"Sampling: every {sample_every} page(s)")
-        print("-" * 60)
+    async def _fetch(self, session, url, limiter):
+        async with limiter:
+            async with session.get(url) as response:
+                limiter.on_response(response.status, response.headers)
+                if response.status in RETRY_STATUSES:
+                    raise RetryableHTTPError(
+                        response.status,
+                        parse_retry_after(response.headers.get("Retry-After")),
+                    )
+                # The session does not decompress; see _decode_and_parse
+                body = await response.read()
+                return body, response.headers.get("Content-Encoding")
+
+    async def fetch_with_retry(self, session, url, limiter, max_retries=MAX_RETRIES):
+        """Fetch a URL, retrying transient failures with exponential backoff.
+
+        Returns (body, content_encoding); the body is still compressed.
+
+        Connection errors, timeouts, 429 and 5xx responses are retried up to
+        max_retries times. A Retry-After header from the server takes
+        precedence over the computed backoff.
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                return await self._fetch(session, url, limiter)
+            except (aiohttp.ClientError, asyncio.TimeoutError, RetryableHTTPError) as e:
+                if attempt == max_retries:
+                    raise
+
+                delay = getattr(e, "retry_after", None)
+                if delay is None:
+                    delay = min(2**attempt, MAX_BACKOFF_SECONDS) + random.random()
+                print(f"Retrying {url} in {delay:.1f}s ({e or type(e).__name__})")
+                await asyncio.sleep(delay)
+
+    async def _scrape_page_async(self, session, semaphore, limiter, page_num):
+        """Fetch a page under the concurrency limit and parse it off the event loop."""
+        try:
+            async with semaphore:
+                body, content_encoding = await self.fetch_with_retry(
+                    session, self.page_url(page_num), limiter
+                )
 
-        total_pages = ((max_page - start_page) // sample_every) + 1
+            loop = asyncio.get_running_loop()
+            articles_on_page, errors = await loop.run_in_executor(
+                None, self._decode_and_parse, body, content_encoding, page_num
+            )
+            self.validation_errors += errors
+            return page_num, articles_on_page
+
+        except Exception as e:
+            print(f"Error scraping page {page_num}: {e}")
+            return page_num, []
+
+    def _decode_and_parse(self, body, content_encoding, page_num):
+        # Runs in an executor thread, keeping decompression off the event loop
+        content = decompress_body(body, content_encoding)
+        return self.parse_page(content, page_num, seen_urls=self.articles)
+
+    async def _scrape_pages_async(self, page_nums, concurrency, rate):
+        total_pages = len(page_nums)
         scraped = 0
 
-        for page_num in range(start_page, max_page + 1, sample_every):
-            scraped += 1
-            print(f"\n[{scraped}/{total_pages}] - Scraping page {page_num:,}...")
+        semaphore = asyncio.Semaphore(concurrency)
+        limiter = AdaptiveLimiter(rate)
+        in_order = PageOrderBuffer(page_nums)
+        connector = aiohttp.TCPConnector(limit_per_host=concurrency)
+        timeout = aiohttp.ClientTimeout(total=15)
+
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers=dict(self.session.headers),
+            auto_decompress=False,
+        ) as session:
+            tasks = [
+                self._scrape_page_async(session, semaphore, limiter, page_num)
+                for page_num in page_nums
+            ]
 
-            articles_on_page = self.scrape_page(page_num)
+            for next_done in asyncio.as_completed(tasks):
+                page_num, articles_on_page = await next_done
+                scraped += 1
+                self._collect_page(
+                    page_num, articles_on_page, scraped, total_pages, in_order
+                )
 
-            if articles_on_page:
-                print(f"Found {len(articles_on_page)} articles")
-                for article in articles_on_page:
-                    self.articles[article["url"]] = article
-            else:
-                print(f"No articles found")
+    def _scrape_pages_threaded(self, page_nums, concurrency, rate):
+        """Thread pool equivalent of _scrape_pages_async over the requests session.
+
+        Used when scrape_all_pages is called from a thread that is already
+        running an event loop (e.g. a notebook), where asyncio.run() fails.
+        """
+        total_pages = len(page_nums)
+        scraped = 0
+        limiter = AdaptiveLimiter(rate)
+        in_order = PageOrderBuffer(page_nums)
 
-            time.sleep(0.5)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                executor.submit(self._fetch_and_parse, page_num, limiter): page_num
+                for page_num in page_nums
+            }
 
-            if scraped % 100 == 0:
-                print(
-                    f"\nProgress: {scraped}/{total_pages} pages scraped, "
-                    f"{len(self.articles):,} articles collected"
+            # Results are merged here, on the calling thread only
+            for future in as_completed(futures):
+                page_num = futures[future]
+                try:
+                    articles_on_page, errors = future.result()
+                    self.validation_errors += errors
+                except Exception as e:
+                    print(f"Error scraping page {page_num}: {e}")
+                    articles_on_page = []
+
+                scraped += 1
+                self._collect_page(
+                    page_num, articles_on_page, scraped, total_pages, in_order
                 )
-                self.save_checkpoint()
+
+    def _collect_page(self, page_num, articles_on_page, scraped, total_pages, in_order):
+        """Report a completed page and add its articles.
+
+        Articles are only added once in_order (a PageOrderBuffer) has seen
+        every earlier page complete, keeping checkpoints free of gaps.
+        """
+        for article in in_order.complete(page_num, articles_on_page):
+            self._add_article(article)
+
+        if articles_on_page:
+            print(
+                f"[{scraped}/{total_pages}] - Page {page_num:,}: "
+                f"found {len(articles_on_page)} new articles"
+            )
+        else:
+            print(f"[{scraped}/{total_pages}] - Page {page_num:,}: no new articles")
+
+        if scraped % 100 == 0:
+            print(
+                f"\nProgress: {scraped}/{total_pages} pages scraped, "
+                f"{len(self.articles):,} articles collected"
+            )
+            self.save_checkpoint()
+
+    def scrape_all_pages(
+        self,
+        max_page,
+        start_page=1,
+        sample_every=1,
+        concurrency=MAX_CONCURRENT_REQUESTS,
+        rate=REQUESTS_PER_SECOND,
+    ):
+        print(f"\nStarting scraping...")
+        print(f"Pages to scrape: {start_page} to {max_page}")
+        print(f"Sampling: every {sample_every} page(s)")
+        print(f"Concurrent requests: {concurrency}, starting rate: {rate}/s")
+        print("-" * 60)
+
+        page_nums = list(range(start_page, max_page + 1, sample_every))
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self._scrape_pages_async(page_nums, concurrency, rate))
+        else:
+            self._scrape_pages_threaded(page_nums, concurrency, rate)
 
         print(f"\nScraping complete!")
         print(f"Total articles collected: {len(self.articles):,}")
         if self.validation_errors > 0:
             print(f"Validation errors skipped: {self.validation_errors}")
 
-        self.rebuild_articles_by_date()
+        # Rewrite the article files in full, compacting the incremental appends
+        self.save_checkpoint(full=True)
+
+    def _add_article(self, article):
+        """Insert or replace an article, keeping the date index and counters in step."""
+        previous = self.articles.get(article["url"])
+        if previous is None:
+            self._pending_articles.append(article)
+        else:
+            self.articles_by_date[previous["date_parsed"]].remove(previous)
+            self._daily_counts[previous["date_parsed"]] -= 1
 
-        self.save_checkpoint()
+        self.articles[article["url"]] = article
+        self.articles_by_date[article["date_parsed"]].append(article)
+        self._daily_counts[article["date_parsed"]] += 1
 
     def rebuild_articles_by_date(self):
         self.articles_by_date = defaultdict(list)
         for article in self.articles.values():
             self.articles_by_date[article["date_parsed"]].append(article)
 
-    def save_checkpoint(self):
+    def _write_articles(self, articles, append):
+        """Write articles to articles.jsonl and articles.csv, appending or replacing."""
+        jsonl_file = os.path.join(self.output_dir, "articles.jsonl")
+        mode = "ab" if append else "wb"
+        with open(jsonl_file, mode, buffering=CHECKPOINT_BUFFER_SIZE) as f:
+            for article in articles:
+                f.write(orjson.dumps(article) + b"\n")
+
+        csv_file = os.path.join(self.output_dir, "articles.csv")
+        write_header = not append or not os.path.exists(csv_file)
+        with open(csv_file, "a" if append else "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=ARTICLE_FIELDS, extrasaction="ignore")
+            if write_header:
+                writer.writeheader()
+            writer.writerows(articles)
+
+    def save_checkpoint(self, full=False):
+        """Persist progress to the output directory.
+
+        Articles seen for the first time since the last save are appended to
+        articles.jsonl and articles.csv, so a checkpoint costs O(new articles).
+        With full=True (end of a scrape) both files are rewritten from
+        self.articles. checkpoint.json only holds the run's metadata.
+        """
         print(f"Saving checkpoint ({len(self.articles):,} articles)...")
 
+        if full or self._needs_full_save:
+            self._write_articles(self.articles.values(), append=False)
+            self._needs_full_save = False
+        elif self._pending_articles:
+            self._write_articles(self._pending_articles, append=True)
+        self._pending_articles = []
+
         checkpoint_file = os.path.join(self.output_dir, "checkpoint.json")
-        with open(checkpoint_file, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "timestamp": datetime.now().isoformat(),
-                    "articles_count": len(self.articles),
-                    "articles": list(self.articles.values()),
-                },
-                f,
-                indent=2,
-                ensure_ascii=False,
+        with open(checkpoint_file, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    {
+                        "timestamp": datetime.now().isoformat(),
+                        "articles_count": len(self.articles),
+                        "articles_file": "articles.jsonl",
+                    }
+                )
             )
 
-        csv_file = os.path.join(self.output_dir, "articles.csv")
-        with open(csv_file, "w", newline="", encoding="utf-8") as f:
-            fieldnames = [
-                "url",
-                "title",
-                "date_raw",
-                "date_parsed",
-                "page_num",
-                "archive_url",
-            ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-            writer.writeheader()
-            writer.writerows(self.articles.values())
-
         report = self.generate_report()
         report_file = os.path.join(self.output_dir, "report.json")
-        with open(report_file, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        with open(report_file, "wb") as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
 
         daily_file = os.path.join(self.output_dir, "daily_summary.csv")
         with open(daily_file, "w", newline="", encoding="utf-8") as f:
@@ -303,29 +880,20 @@ class Q2BStudioAuditor:
                 count = report["daily_statistics"]["articles_per_day"][date]
                 writer.writerow([date, count])
 
-        print("Checkpoint saved: CSV, JSON, Report, Daily summary")
+        print("Checkpoint saved: CSV, JSONL, Report, Daily summary")
 
     def generate_report(self):
         print("\nGenerating report...")
-        all_unique_articles = list(self.articles.values())
-
-        sorted_articles = sorted(
-            all_unique_articles,
-            key=lambda x: (
-                x["date_parsed"] if x["date_parsed"] != "UNKNOWN_DATE" else "9999-12-31"
-            ),
-        )
-
-        daily_stats = defaultdict(int)
-
-        for article in all_unique_articles:
-            daily_stats[article["date_parsed"]] += 1
+        # Derived from the per-date counters: O(unique dates), not O(articles)
+        daily_stats = {
+            date: count for date, count in self._daily_counts.items() if count > 0
+        }
 
         known_date_articles_per_day = {
             date: count for date, count in daily_stats.items() if date != UNKNOWN_DATE
         }
 
-        total_unique_articles = len(all_unique_articles)
+        total_unique_articles = len(self.articles)
         num_known_dates = len(known_date_articles_per_day)
 
         average_per_day = (
@@ -340,16 +908,25 @@ class Q2BStudioAuditor:
             min(known_date_articles_per_day.values()) if num_known_dates > 0 else 0
         )
 
+        # Unknown dates sort after every real date
+        if not total_unique_articles:
+            earliest = latest = None
+        else:
+            earliest = (
+                min(known_date_articles_per_day) if num_known_dates else UNKNOWN_DATE
+            )
+            latest = (
+                UNKNOWN_DATE
+                if UNKNOWN_DATE in daily_stats
+                else max(known_date_articles_per_day)
+            )
+
         report = {
             "generated_at": datetime.now().isoformat(),
             "total_articles": total_unique_articles,
             "date_range": {
-                "earliest": (
-                    sorted_articles[0]["date_parsed"] if sorted_articles else None
-                ),
-                "latest": (
-                    sorted_articles[-1]["date_parsed"] if sorted_articles else None
-                ),
+                "earliest": earliest,
+                "latest": latest,
             },
             "daily_statistics": {
                 "dates": num_known_dates,
@@ -378,22 +955,30 @@ class Q2BStudioAuditor:
             return False
 
         try:
-            with open(checkpoint_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(checkpoint_file, "rb") as f:
+                data = orjson.loads(f.read())
 
             # Validate checkpoint data structure
             if not isinstance(data, dict):
                 print("Invalid checkpoint format: not a dictionary")
                 return False
             
-            if "articles" not in data:
-                print("Invalid checkpoint format: missing 'articles' key")
-                return False
-            
-            articles_list = data.get("articles", [])
-            if not isinstance(articles_list, list):
-                print("Invalid checkpoint format: 'articles' is not a list")
-                return False
+            if "articles" in data:
+                # Older checkpoints embed the full article list
+                articles_list = data["articles"]
+                if not isinstance(articles_list, list):
+                    print("Invalid checkpoint format: 'articles' is not a list")
+                    return False
+                needs_full_save = True
+            else:
+                articles_file = os.path.join(
+                    checkpoint_dir, data.get("articles_file", "articles.jsonl")
+                )
+                if not os.path.exists(articles_file):
+                    print("Invalid checkpoint format: no articles found")
+                    return False
+                articles_list = self._read_articles_jsonl(articles_file)
+                needs_full_save = False
             
             # Load articles with validation
             valid_count = 0
@@ -406,7 +991,14 @@ class Q2BStudioAuditor:
                 else:
                     invalid_count += 1
 
+            # One pass to index everything loaded, rather than going
+            # through _add_article (which would queue it all for appending)
             self.rebuild_articles_by_date()
+            self._daily_counts = Counter(
+                article["date_parsed"] for article in self.articles.values()
+            )
+            self._pending_articles = []
+            self._needs_full_save = needs_full_save or invalid_count > 0
 
             self.output_dir = checkpoint_dir
 
@@ -421,31 +1013,36 @@ class Q2BStudioAuditor:
 
             return max_page_scraped
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             print(f"Error: Checkpoint file is not valid JSON")
             return False
         except Exception as e:
             print(f"Error loading checkpoint: {str(e)}")
             return False
 
-    def extract_article_id(self, url):
-        try:
-            parts = url.split("/")
-            for i, part in enumerate(parts):
-                if part == "nuestro-blog" and i + 1 < len(parts):
-                    return int(parts[i + 1])
-        except:
-            pass
-        return None
+    @staticmethod
+    def _read_articles_jsonl(articles_file):
+        """Yield articles from a JSONL file, skipping lines that fail to decode.
 
-    def get_min_article_id(self):
-        min_id = float("inf")
-        for article in self.articles.values():
-            article_id = self.extract_article_id(article["url"])
-            if article_id and article_id < min_id:
-                min_id = article_id
+        A run interrupted mid-append can leave a truncated last line behind.
+        """
+        with open(articles_file, "rb") as f:
+            for line in f:
+                try:
+                    yield orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
 
-        return min_id if min_id != float("inf") else 0
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def extract_article_id(url):
+        match = _ARTICLE_ID_RE.search(url)
+        return int(match[1]) if match else None
+
+    def get_min_article_id(self):
+        ids = map(self.extract_article_id, self.articles)
+        # An ID of 0 is ignored, as 0 doubles as the "no articles" result
+        return min(filter(None, ids), default=0)
 
     def calculate_resume_page(self, max_page, articles_per_page=9):
         min_id = self.get_min_article_id()
@@ -30,12 +30,16 @@ from wayback_archiver import WaybackArchiver
 # ---------------------------------------------------------------------------
 
 
-def _select_or_create_output_dir(resume: bool) -> Tuple[Q2BStudioAuditor, int, int]:
+def _select_or_create_output_dir(
+    resume: bool, need_max_page: bool = True
+) -> Tuple[Q2BStudioAuditor, int, int]:
     """Create an auditor and decide start/max page.
 
     - If resume is True, we try to auto-detect the latest checkpoint directory
       and resume from there.
     - If resume is False, we start a fresh run with a new timestamped directory.
+    - If need_max_page is False (nothing will be scraped), the site is not
+      queried for its page count and (auditor, 0, 0) is returned.
 
     Returns:
         (auditor, start_page, max_page)
@@ -59,6 +63,8 @@ def _select_or_create_output_dir(resume: bool) -> Tuple[Q2BStudioAuditor, int, i
             print(f"[run.py] Attempting to resume from checkpoint: {latest}")
             max_page_scraped = auditor.load_checkpoint(latest)
             if max_page_scraped:
+                if not need_max_page:
+                    return auditor, 0, 0
                 max_page = auditor.get_max_page_number()
                 if not max_page:
                     raise SystemExit("Could not determine max page from site.")
@@ -75,6 +81,9 @@ def _select_or_create_output_dir(resume: bool) -> Tuple[Q2BStudioAuditor, int, i
         os.makedirs(auditor.output_dir, exist_ok=True)
         print(f"[run.py] Created output directory: {auditor.output_dir}")
 
+    if not need_max_page:
+        return auditor, 0, 0
+
     max_page = auditor.get_max_page_number()
     if not max_page:
         raise SystemExit("Could not determine max page from site.")
@@ -112,11 +121,16 @@ def run_scrape(auditor: Q2BStudioAuditor, start_page: int, max_page: int, sample
 
 
 
-def run_analysis_and_visualization(auditor: Q2BStudioAuditor) -> None:
-    """Generate report.json and graphs from the current auditor state."""
+def run_analysis_and_visualization(auditor: Q2BStudioAuditor, fast: bool = False) -> None:
+    """Generate report.json and graphs from the current auditor state.
+
+    Args:
+        auditor: Initialized Q2BStudioAuditor instance.
+        fast: Render graphs at screen resolution instead of archival DPI.
+    """
 
     report = auditor.generate_report()
-    visualizer = Q2BDataVisualizer(input_dir=auditor.output_dir)
+    visualizer = Q2BDataVisualizer(input_dir=auditor.output_dir, fast=fast)
     visualizer.create_visualizations(report)
     print(f"[run.py] Analysis + visualizations complete in: {auditor.output_dir}")
 
@@ -164,6 +178,12 @@ def build_parser() -> argparse.ArgumentParser:
         ),
     )
 
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Render graphs at screen resolution (150 DPI) instead of 300 DPI.",
+    )
+
     parser.add_argument(
         "--sample",
         type=int,
@@ -193,18 +213,20 @@ def main() -> None:
     # Visualize-only implies resume
     resume_flag = args.resume or args.visualize_only
 
-    auditor, start_page, max_page = _select_or_create_output_dir(resume=resume_flag)
+    auditor, start_page, max_page = _select_or_create_output_dir(
+        resume=resume_flag, need_max_page=not args.visualize_only
+    )
 
     if args.visualize_only:
         print("[run.py] Visualization-only mode: no scraping will be performed.")
-        run_analysis_and_visualization(auditor)
+        run_analysis_and_visualization(auditor, fast=args.fast)
         if args.archive:
             run_archiving(auditor, sample_size=args.archive)
         return
 
     # Full pipeline: scrape -> analyze/visualize -> optional archive
     run_scrape(auditor, start_page=start_page, max_page=max_page, sample_every=args.sample)
-    run_analysis_and_visualization(auditor)
+    run_analysis_and_visualization(auditor, fast=args.fast)
 
     if args.archive:
         run_archiving(auditor, sample_size=args.archive)
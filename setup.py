@@ -34,6 +34,7 @@ setup(
         'wayback_archiver',
         'similarity_analyzer',
         'dashboard',
+        'fast_agg',
         'main',
     ],
     classifiers=[
@@ -54,13 +55,21 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "requests>=2.31.0",
-        "beautifulsoup4>=4.12.0",
+        "aiohttp>=3.9.0",
+        "lxml>=5.0.0",
+        "orjson>=3.9.0",
+        "numpy>=2.0.0",
         "matplotlib>=3.7.0",
         "streamlit>=1.28.0",
         "plotly>=5.17.0",
         "pandas>=2.0.0",
+        "pyarrow>=14.0.0",
     ],
     extras_require={
+        "fast": [
+            "numba>=0.58.0",
+            "simsimd>=5.0.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "black>=23.0.0",
@@ -10,13 +10,198 @@ Detects duplicate and similar content using:
 This module enables automated detection of industrialized content duplication.
 """
 
-import json
 import csv
+import heapq
+import multiprocessing
 import os
-from collections import defaultdict
+from functools import lru_cache
 from typing import List, Dict, Tuple, Set
 import re
 
+import numpy as np
+import orjson
+import pandas as pd
+
+try:
+    import simsimd
+except ImportError:  # simsimd is optional
+    simsimd = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
+
+
+# MinHash LSH settings for datasets too large for exhaustive comparison
+MINHASH_NUM_PERM = 128
+MINHASH_SEED = 1
+# Relative cost of a false positive LSH candidate vs a missed pair
+MINHASH_FALSE_POSITIVE_WEIGHT = 0.1
+# N-grams hashed per block when computing signatures (bounds a
+# block x num_perm uint64 temporary)
+MINHASH_BLOCK_SIZE = 65536
+# LSH buckets with more members than this are scored exactly instead of
+# being expanded into candidate pairs (bounds the per-band candidate array)
+LSH_MAX_BUCKET_SIZE = 256
+# Rows per similarity tile (bounds a tile_rows x n float64 block)
+SIMILARITY_TILE_ROWS = 1024
+# Processes/threads used for exhaustive scoring, and the pair count below
+# which a process pool is not worth starting
+SIMILARITY_WORKERS = os.cpu_count() or 1
+MIN_COMPARISONS_FOR_POOL = 2_000_000
+# Most similar pairs kept in memory and saved to similar_pairs.json (all
+# pairs are streamed to similar_pairs.jsonl)
+SIMILAR_PAIRS_TOP_K = 1000
+
+_URL_RE = re.compile(r'http[s]?://\S+')
+# Byte table keeping a-z0-9 and mapping every other byte to a space
+_ALNUM_TABLE = bytes(
+    c if chr(c) in "abcdefghijklmnopqrstuvwxyz0123456789" else ord(" ") for c in range(256)
+)
+
+
+@lru_cache(maxsize=None)
+def _normalize_text(text: str) -> str:
+    """Cached body of SimilarityAnalyzer.normalize_text (titles repeat across passes)."""
+    if not text:
+        return ""
+    
+    # Convert to lowercase and remove URLs
+    text = _URL_RE.sub('', text.lower())
+    
+    # Keep only alphanumeric (non-ASCII becomes "?", then a space) and
+    # normalize whitespace
+    data = text.encode('ascii', 'replace').translate(_ALNUM_TABLE)
+    return b' '.join(data.split()).decode('ascii')
+
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer: a bijective 64-bit mix (uint64 arithmetic wraps)."""
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _lsh_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Choose the LSH banding (bands, rows per band) for a Jaccard threshold.
+
+    Minimises the weighted probability mass of false positives below the
+    threshold plus false negatives above it, the criterion datasketch uses.
+    Candidates are verified exactly, so false negatives weigh more.
+    """
+    similarity = np.linspace(0.0, 1.0, 201)
+    below = similarity < threshold
+    best, best_error = (1, num_perm), float("inf")
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            candidate = 1.0 - (1.0 - similarity ** rows) ** bands
+            error = (
+                MINHASH_FALSE_POSITIVE_WEIGHT * candidate[below].sum()
+                + (1.0 - MINHASH_FALSE_POSITIVE_WEIGHT) * (1.0 - candidate[~below]).sum()
+            )
+            if error < best_error:
+                best, best_error = (bands, rows), error
+    return best
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _jaccard_tile(ids, offsets, limits, vocab_size, start, stop):
+        """
+        Jaccard similarity of rows [start, stop) against rows i < j < limits[i].
+
+        Row i's n-grams are marked in a vocabulary-sized lookup table, so
+        each intersection is one table probe per n-gram of row j.
+        Entries outside that range are -1.
+        """
+        out = np.full((stop - start, limits[stop - 1]), -1.0)
+        for row in prange(stop - start):
+            i = start + row
+            marked = np.zeros(vocab_size, np.bool_)
+            for p in range(offsets[i], offsets[i + 1]):
+                marked[ids[p]] = True
+            size_i = offsets[i + 1] - offsets[i]
+            for j in range(i + 1, limits[i]):
+                intersection = 0
+                for q in range(offsets[j], offsets[j + 1]):
+                    intersection += marked[ids[q]]
+                union = size_i + (offsets[j + 1] - offsets[j]) - intersection
+                out[row, j] = intersection / union
+        return out
+
+
+def _connected_groups(groups: List[np.ndarray], n: int) -> List[np.ndarray]:
+    """
+    Merge arrays of row indices < n that share a row into connected components.
+    
+    Returns each component's rows in ascending order.
+    """
+    heads = np.concatenate([np.full(len(group) - 1, group[0]) for group in groups])
+    tails = np.concatenate([group[1:] for group in groups])
+    # Min-label propagation with pointer jumping; labels only ever point
+    # to a lower row in the same component
+    label = np.arange(n)
+    while True:
+        low = np.minimum(label[heads], label[tails])
+        if np.array_equal(low, label[heads]) and np.array_equal(low, label[tails]):
+            break
+        np.minimum.at(label, heads, low)
+        np.minimum.at(label, tails, low)
+        label = label[label]
+    
+    rows = np.union1d(heads, tails)
+    order = np.argsort(label[rows], kind="stable")
+    rows, labels = rows[order], label[rows][order]
+    return np.split(rows, np.flatnonzero(labels[1:] != labels[:-1]) + 1)
+
+
+def _size_limits(sizes: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    For n-gram counts sorted ascending, the end of each row's comparison range.
+    
+    J(A, B) <= min(|A|, |B|) / max(|A|, |B|), so row i only needs comparing
+    with the following rows of at most |A| / threshold n-grams.
+    """
+    if threshold > 0:
+        return np.searchsorted(sizes, sizes / threshold + 1e-9, side="right")
+    return np.full(len(sizes), len(sizes))
+
+
+def _score_rows(bits, sizes, limits, threshold, start, stop):
+    """
+    Score rows [start, stop) against rows i < j < limits[i] with NumPy popcounts.
+    
+    Returns:
+        (rows, cols, similarity, comparisons) for the pairs >= threshold
+    """
+    rows, cols, scores = [], [], []
+    for i in range(start, stop):
+        later = slice(i + 1, limits[i])
+        intersection = np.bitwise_count(bits[later] & bits[i]).sum(axis=1, dtype=np.int64)
+        similarity = intersection / (sizes[i] + sizes[later] - intersection)
+        matches = np.flatnonzero(similarity >= threshold)
+        rows.append(np.full(len(matches), i))
+        cols.append(matches + i + 1)
+        scores.append(similarity[matches])
+    comparisons = int((limits[start:stop] - np.arange(start, stop) - 1).sum())
+    return np.concatenate(rows), np.concatenate(cols), np.concatenate(scores), comparisons
+
+
+_worker_state = {}
+
+
+def _init_score_worker(bits, sizes, limits, threshold):
+    """Pool initializer: keep the shared scoring inputs in the worker."""
+    _worker_state.update(bits=bits, sizes=sizes, limits=limits, threshold=threshold)
+
+
+def _score_row_block(block):
+    start, stop = block
+    return _score_rows(start=start, stop=stop, **_worker_state)
+
 
 class SimilarityAnalyzer:
     """Analyzes article titles for similarity and duplication patterns."""
@@ -31,8 +216,12 @@ class SimilarityAnalyzer:
         """
         self.input_dir = input_dir
         self.similarity_threshold = similarity_threshold
-        self.articles = []
+        # Article columns, indexed by row number
+        self.titles: List[str] = []
+        self.urls: List[str] = []
+        self.dates: List[str] = []
         self.duplicates = []
+        self.num_similar_pairs = 0
         self.clusters = []
 
     def load_articles(self) -> bool:
@@ -44,11 +233,27 @@ class SimilarityAnalyzer:
             return False
 
         print(f"Loading articles from {csv_file}...")
-        with open(csv_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            self.articles = list(reader)
+        # Only the columns used here, as plain strings with "" (not NaN) for
+        # empty fields
+        try:
+            df = pd.read_csv(
+                csv_file,
+                usecols=lambda column: column in ("title", "url", "date_parsed"),
+                dtype=str,
+                keep_default_na=False,
+                encoding="utf-8",
+            )
+        except pd.errors.EmptyDataError:
+            df = pd.DataFrame()
+        
+        def column(name):
+            return df[name].tolist() if name in df else [""] * len(df)
+        
+        self.titles = column("title")
+        self.urls = column("url")
+        self.dates = column("date_parsed")
 
-        print(f"Loaded {len(self.articles):,} articles for analysis")
+        print(f"Loaded {len(self.titles):,} articles for analysis")
         return True
 
     def normalize_text(self, text: str) -> str:
@@ -59,45 +264,39 @@ class SimilarityAnalyzer:
         - Remove special characters
         - Normalize whitespace
         """
-        if not text:
-            return ""
-        
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove URLs
-        text = re.sub(r'http[s]?://\S+', '', text)
-        
-        # Keep only alphanumeric and spaces
-        text = re.sub(r'[^a-z0-9\s]', ' ', text)
-        
-        # Normalize whitespace
-        text = ' '.join(text.split())
-        
-        return text
+        return _normalize_text(text)
 
-    def generate_ngrams(self, text: str, n: int = 3) -> Set[str]:
+    def generate_ngrams(self, text: str, n: int = 3) -> Set[int]:
         """
         Generate character n-grams from text.
         
+        Normalized text is ASCII, so each n-gram is packed big-endian into
+        an int (one byte per character), which is collision-free and much
+        smaller and cheaper to hash than a str.
+        
         Args:
             text: Input text
-            n: N-gram size (default: 3)
+            n: N-gram size (default: 3, at most 8)
             
         Returns:
-            Set of n-grams
+            Set of packed n-grams
         """
-        text = self.normalize_text(text)
-        if len(text) < n:
-            return {text}
+        if not 1 <= n <= 8:
+            raise ValueError(f"n-gram size must be between 1 and 8, got {n}")
+        
+        data = self.normalize_text(text).encode("ascii")
+        if len(data) < n:
+            return {int.from_bytes(data, "big")}
         
-        ngrams = set()
-        for i in range(len(text) - n + 1):
-            ngrams.add(text[i:i+n])
+        chars = np.frombuffer(data, dtype=np.uint8)
+        count = len(chars) - n + 1
+        packed = chars[:count].astype(np.uint64)
+        for k in range(1, n):
+            packed = (packed << np.uint64(8)) | chars[k:k + count]
         
-        return ngrams
+        return set(packed.tolist())
 
-    def calculate_jaccard_similarity(self, set1: Set[str], set2: Set[str]) -> float:
+    def calculate_jaccard_similarity(self, set1: Set[int], set2: Set[int]) -> float:
         """
         Calculate Jaccard similarity between two sets.
         
@@ -109,13 +308,49 @@ class SimilarityAnalyzer:
         if not set1 or not set2:
             return 0.0
         
+        # |A ∪ B| = |A| + |B| - |A ∩ B|, without building the union set
         intersection = len(set1 & set2)
-        union = len(set1 | set2)
+        return intersection / (len(set1) + len(set2) - intersection)
+
+    def intern_ngrams(self, ngram_sets: List[Set[int]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Intern n-grams to integer IDs.
         
-        if union == 0:
-            return 0.0
+        Returns:
+            (ids, offsets): article k's n-gram IDs are
+            ids[offsets[k]:offsets[k + 1]]
+        """
+        vocab: Dict[int, int] = {}
+        ids = np.fromiter(
+            (vocab.setdefault(ngram, len(vocab)) for ngrams in ngram_sets for ngram in ngrams),
+            dtype=np.int32,
+        )
+        offsets = np.zeros(len(ngram_sets) + 1, dtype=np.int64)
+        np.cumsum([len(ngrams) for ngrams in ngram_sets], out=offsets[1:])
+        return ids, offsets
+
+    def pack_ngram_bitsets(self, ids: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+        """
+        Pack interned n-gram sets into bitset rows.
+        
+        Jaccard similarity of two rows is then
+        popcount(a & b) / (|a| + |b| - popcount(a & b)).
         
-        return intersection / union
+        Returns:
+            An (n, ceil(V / 64)) uint64 matrix over the vocabulary of V
+            distinct n-grams
+        """
+        vocab_size = int(ids.max()) + 1 if len(ids) else 0
+        rows = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+        positions = ids.astype(np.int64)
+        
+        bits = np.zeros((len(offsets) - 1, (vocab_size + 63) // 64), dtype=np.uint64)
+        np.bitwise_or.at(
+            bits,
+            (rows, positions >> 6),
+            np.left_shift(np.uint64(1), (positions & 63).astype(np.uint64)),
+        )
+        return bits
 
     def find_similar_pairs(self, ngram_size: int = 3) -> List[Dict]:
         """
@@ -125,77 +360,362 @@ class SimilarityAnalyzer:
             ngram_size: Size of character n-grams to use
             
         Returns:
-            List of similar article pairs with similarity scores
+            The SIMILAR_PAIRS_TOP_K most similar pairs; every pair is
+            streamed to similar_pairs.jsonl
         """
         print(f"\nAnalyzing title similarity (n-gram size: {ngram_size})...")
         print(f"Threshold: {self.similarity_threshold}")
         
-        similar_pairs = []
+        # Generate n-grams for all articles, ordered by n-gram count
+        article_ngrams = [self.generate_ngrams(title, n=ngram_size) for title in self.titles]
+        order = np.argsort([len(ngrams) for ngrams in article_ngrams], kind="stable")
+        ids, offsets = self.intern_ngrams([article_ngrams[k] for k in order])
         
-        # Generate n-grams for all articles
-        article_ngrams = []
-        for article in self.articles:
-            title = article.get("title", "")
-            ngrams = self.generate_ngrams(title, n=ngram_size)
-            article_ngrams.append((article, ngrams))
+        n = len(article_ngrams)
+        limits = _size_limits(np.diff(offsets), self.similarity_threshold)
         
-        # Compare all pairs
-        total_comparisons = len(article_ngrams) * (len(article_ngrams) - 1) // 2
-        print(f"Performing {total_comparisons:,} pairwise comparisons...")
+        total_comparisons = int((limits - np.arange(n) - 1).sum())
+        skipped = n * (n - 1) // 2 - total_comparisons
+        print(f"Performing {total_comparisons:,} pairwise comparisons ({skipped:,} pruned by size)...")
         
+        first, second, scores = [], [], []
         compared = 0
-        for i in range(len(article_ngrams)):
-            for j in range(i + 1, len(article_ngrams)):
-                article1, ngrams1 = article_ngrams[i]
-                article2, ngrams2 = article_ngrams[j]
-                
-                similarity = self.calculate_jaccard_similarity(ngrams1, ngrams2)
-                
-                if similarity >= self.similarity_threshold:
-                    similar_pairs.append({
-                        "article1": {
-                            "title": article1.get("title", ""),
-                            "url": article1.get("url", ""),
-                            "date": article1.get("date_parsed", ""),
-                        },
-                        "article2": {
-                            "title": article2.get("title", ""),
-                            "url": article2.get("url", ""),
-                            "date": article2.get("date_parsed", ""),
-                        },
-                        "similarity": round(similarity, 4),
-                    })
+        for rows, cols, similarity, comparisons in self._iter_similar_pairs(ids, offsets, limits):
+            # Map back to the original article order, lower index first
+            rows, cols = order[rows], order[cols]
+            first.append(np.minimum(rows, cols))
+            second.append(np.maximum(rows, cols))
+            scores.append(similarity)
+            
+            previous = compared
+            compared += comparisons
+            if compared // 100000 > previous // 100000:
+                print(f"  Progress: {compared:,}/{total_comparisons:,} comparisons")
+        
+        if not scores:
+            return self._record_pairs([])
+        
+        first, second, scores = np.concatenate(first), np.concatenate(second), np.concatenate(scores)
+        pair_order = np.lexsort((second, first))
+        return self._record_pairs(
+            zip(first[pair_order].tolist(), second[pair_order].tolist(), scores[pair_order].tolist())
+        )
+
+    def _iter_similar_pairs(self, ids: np.ndarray, offsets: np.ndarray, limits: np.ndarray):
+        """
+        Yield the pairs i < j < limits[i] at or above the similarity threshold.
+        
+        limits must be non-decreasing. Pairs come in blocks of (rows, cols,
+        similarity, comparisons), in no particular order. With simsimd
+        installed each block is one multithreaded SIMD cdist tile of
+        SIMILARITY_TILE_ROWS rows; with numba, the same tile is scored by a
+        parallel JIT kernel; otherwise blocks of rows with equal work are
+        scored with NumPy popcounts, across a process pool for large inputs.
+        """
+        n = len(offsets) - 1
+        sizes = np.diff(offsets)
+        if n < 2:
+            return
+        
+        if simsimd is None and njit is not None:
+            vocab_size = int(ids.max()) + 1 if len(ids) else 0
+            for start in range(0, n, SIMILARITY_TILE_ROWS):
+                stop = min(start + SIMILARITY_TILE_ROWS, n)
+                similarity = _jaccard_tile(ids, offsets, limits, vocab_size, start, stop)
+                local_rows, cols = np.nonzero(similarity >= self.similarity_threshold)
+                comparisons = int((limits[start:stop] - np.arange(start, stop) - 1).sum())
+                yield local_rows + start, cols, similarity[local_rows, cols], comparisons
+            return
+        
+        bits = self.pack_ngram_bitsets(ids, offsets)
+        if simsimd is not None:
+            packed = bits.view(np.uint8)
+            for start in range(0, n, SIMILARITY_TILE_ROWS):
+                stop = min(start + SIMILARITY_TILE_ROWS, n)
+                distance = np.asarray(
+                    simsimd.cdist(
+                        packed[start:stop],
+                        packed[start:limits[stop - 1]],
+                        metric="jaccard",
+                        dtype="bin8",
+                        threads=SIMILARITY_WORKERS,
+                    )
+                )
+                # Distances are floating point: keep a margin, then rescore exactly
+                local_rows, local_cols = np.nonzero(distance <= 1.0 - self.similarity_threshold + 1e-6)
+                rows, cols = local_rows + start, local_cols + start
+                in_range = (cols > rows) & (cols < limits[rows])
+                rows, cols = rows[in_range], cols[in_range]
                 
-                compared += 1
-                if compared % 100000 == 0:
-                    print(f"  Progress: {compared:,}/{total_comparisons:,} comparisons")
+                intersection = np.bitwise_count(bits[rows] & bits[cols]).sum(axis=1, dtype=np.int64)
+                similarity = intersection / (sizes[rows] + sizes[cols] - intersection)
+                keep = similarity >= self.similarity_threshold
+                comparisons = int((limits[start:stop] - np.arange(start, stop) - 1).sum())
+                yield rows[keep], cols[keep], similarity[keep], comparisons
+            return
+        
+        # Split rows into contiguous blocks of roughly equal comparison counts
+        work = np.cumsum(limits - np.arange(n) - 1)
+        num_blocks = min(n, max(64, SIMILARITY_WORKERS * 8))
+        targets = np.linspace(0, work[-1], num_blocks + 1)[1:-1]
+        bounds = np.unique(np.r_[0, np.searchsorted(work, targets) + 1, n])
+        blocks = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+        
+        if SIMILARITY_WORKERS > 1 and work[-1] >= MIN_COMPARISONS_FOR_POOL:
+            with multiprocessing.Pool(
+                SIMILARITY_WORKERS,
+                initializer=_init_score_worker,
+                initargs=(bits, sizes, limits, self.similarity_threshold),
+            ) as pool:
+                yield from pool.imap_unordered(_score_row_block, blocks)
+            return
+        
+        for start, stop in blocks:
+            yield _score_rows(bits, sizes, limits, self.similarity_threshold, start, stop)
+
+    def find_similar_pairs_lsh(
+        self, ngram_size: int = 3, num_perm: int = MINHASH_NUM_PERM
+    ) -> List[Dict]:
+        """
+        Find pairs of articles with similar titles using MinHash LSH.
+        
+        Only pairs that share an LSH bucket are scored, with the same exact
+        Jaccard similarity as find_similar_pairs, so reported pairs are
+        exact; a small fraction of pairs near the threshold may be missed.
+        Buckets of more than LSH_MAX_BUCKET_SIZE articles are merged with
+        the buckets they overlap and scored exhaustively, rather than
+        expanded into candidate pairs.
+        
+        Args:
+            ngram_size: Size of character n-grams to use
+            num_perm: Number of MinHash permutations
+            
+        Returns:
+            The SIMILAR_PAIRS_TOP_K most similar pairs; every pair is
+            streamed to similar_pairs.jsonl
+        """
+        print(f"\nAnalyzing title similarity with MinHash LSH (n-gram size: {ngram_size})...")
+        print(f"Threshold: {self.similarity_threshold}")
+        
+        article_ngrams = [self.generate_ngrams(title, n=ngram_size) for title in self.titles]
+        
+        signatures = self._minhash_signatures(article_ngrams, num_perm)
+        candidates, large_buckets = self._lsh_candidate_pairs(signatures)
+        
+        n = len(article_ngrams)
+        bucket_codes = np.empty(0, dtype=np.int64)
+        bucket_scores = np.empty(0)
+        if large_buckets:
+            # Components are disjoint, so no pair is scored twice
+            components = _connected_groups(large_buckets, n)
+            print(
+                f"Scoring {len(large_buckets):,} oversized LSH buckets exhaustively "
+                f"({len(components):,} groups, {sum(map(len, components)):,} articles)..."
+            )
+            codes, scores = zip(*(self._score_bucket(article_ngrams, members) for members in components))
+            bucket_codes, bucket_scores = np.concatenate(codes), np.concatenate(scores)
+            order = np.argsort(bucket_codes)
+            bucket_codes, bucket_scores = bucket_codes[order], bucket_scores[order]
+        
+        # Drop candidates already scored with their bucket, and those whose
+        # set sizes alone rule out the threshold
+        candidates = candidates[~np.isin(candidates[:, 0] * n + candidates[:, 1], bucket_codes)]
+        sizes = np.array([len(ngrams) for ngrams in article_ngrams], dtype=np.int64)
+        smaller = np.minimum(sizes[candidates[:, 0]], sizes[candidates[:, 1]])
+        larger = np.maximum(sizes[candidates[:, 0]], sizes[candidates[:, 1]])
+        candidates = candidates[smaller >= larger * self.similarity_threshold - 1e-9]
+        print(f"Scoring {len(candidates):,} candidate pairs...")
+        
+        return self._record_pairs(
+            heapq.merge(
+                self._verify_candidates(article_ngrams, sizes.tolist(), candidates),
+                self._iter_scored_codes(bucket_codes, bucket_scores, n),
+            )
+        )
+
+    def _verify_candidates(self, article_ngrams: List[Set[int]], sizes: List[int], candidates: np.ndarray):
+        """Yield the (i, j, similarity) candidate pairs at or above the threshold."""
+        for i, j in candidates.tolist():
+            intersection = len(article_ngrams[i] & article_ngrams[j])
+            similarity = intersection / (sizes[i] + sizes[j] - intersection)
+            if similarity >= self.similarity_threshold:
+                yield i, j, similarity
+
+    def _iter_scored_codes(self, codes: np.ndarray, scores: np.ndarray, n: int):
+        """Yield (i, j, similarity) for pair codes i * n + j, a block at a time."""
+        for start in range(0, len(codes), SIMILARITY_TILE_ROWS * 64):
+            stop = start + SIMILARITY_TILE_ROWS * 64
+            first, second = np.divmod(codes[start:stop], n)
+            yield from zip(first.tolist(), second.tolist(), scores[start:stop].tolist())
+
+    def _minhash_signatures(self, ngram_sets: List[Set[int]], num_perm: int) -> np.ndarray:
+        """
+        Compute an (n_articles, num_perm) MinHash signature matrix.
         
-        self.duplicates = similar_pairs
-        print(f"\nFound {len(similar_pairs):,} similar pairs (>= {self.similarity_threshold})")
+        Each permutation hashes a packed n-gram x as mix64(x ^ seed) with
+        its own random 64-bit seed.
+        """
+        rng = np.random.default_rng(MINHASH_SEED)
+        seeds = rng.integers(0, 1 << 64, size=num_perm, dtype=np.uint64, endpoint=False)
+        
+        # Every set has at least one n-gram, which reduceat below relies on
+        lengths = np.fromiter((len(s) for s in ngram_sets), dtype=np.int64, count=len(ngram_sets))
+        offsets = np.zeros(len(ngram_sets) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        packed = np.fromiter(
+            (ngram for ngrams in ngram_sets for ngram in ngrams),
+            dtype=np.uint64,
+            count=int(offsets[-1]),
+        )
+        
+        signatures = np.empty((len(ngram_sets), num_perm), dtype=np.uint64)
+        start = 0
+        while start < len(ngram_sets):
+            # Take whole articles until the block holds MINHASH_BLOCK_SIZE n-grams
+            stop = int(np.searchsorted(offsets, offsets[start] + MINHASH_BLOCK_SIZE, side="right")) - 1
+            stop = min(max(stop, start + 1), len(ngram_sets))
+            lo, hi = offsets[start], offsets[stop]
+            permuted = _mix64(packed[lo:hi, None] ^ seeds)
+            signatures[start:stop] = np.minimum.reduceat(permuted, offsets[start:stop] - lo, axis=0)
+            start = stop
+        
+        return signatures
+
+    def _lsh_candidate_pairs(self, signatures: np.ndarray) -> Tuple[np.ndarray, List[np.ndarray]]:
+        """
+        Return the (i, j) pairs, i < j, that share at least one LSH band.
+        
+        Pairs come back sorted, matching the order of the exhaustive loop.
+        Each band's pairs are merged into the running set as it is built,
+        so memory stays proportional to the distinct candidates. Buckets of
+        more than LSH_MAX_BUCKET_SIZE articles are not expanded; their
+        distinct (ascending) member arrays are returned instead.
+        """
+        n, num_perm = signatures.shape
+        bands, rows = _lsh_bands(self.similarity_threshold, num_perm)
+        print(f"LSH banding: {bands} bands x {rows} rows")
+        
+        candidates = np.empty(0, dtype=np.int64)
+        large_buckets = {}  # member bytes -> members
+        for band in range(bands):
+            band_values = signatures[:, band * rows:(band + 1) * rows]
+            _, bucket = np.unique(band_values, axis=0, return_inverse=True)
+            bucket = bucket.ravel()
+            
+            order = np.argsort(bucket, kind="stable")
+            sorted_buckets = bucket[order]
+            starts = np.flatnonzero(np.r_[True, sorted_buckets[1:] != sorted_buckets[:-1]])
+            sizes = np.diff(np.r_[starts, n])
+            pair_codes = []
+            for start, size in zip(starts[sizes > 1], sizes[sizes > 1]):
+                # Stable sort keeps members ascending, so first < second
+                members = order[start:start + size]
+                if size > LSH_MAX_BUCKET_SIZE:
+                    large_buckets.setdefault(members.tobytes(), members)
+                    continue
+                first, second = np.triu_indices(size, k=1)
+                pair_codes.append(members[first] * n + members[second])
+            
+            if pair_codes:
+                candidates = np.union1d(candidates, np.concatenate(pair_codes))
+        
+        return np.stack(np.divmod(candidates, n), axis=1), list(large_buckets.values())
+
+    def _score_bucket(self, article_ngrams: List[Set[int]], members: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exactly score every pair of articles within a group of LSH buckets.
+        
+        Returns:
+            (codes, similarity) for the pairs at or above the threshold,
+            each pair (i, j), i < j, encoded as i * n + j
+        """
+        n = len(article_ngrams)
+        members = members[np.argsort([len(article_ngrams[k]) for k in members], kind="stable")]
+        ids, offsets = self.intern_ngrams([article_ngrams[k] for k in members])
+        limits = _size_limits(np.diff(offsets), self.similarity_threshold)
+        
+        codes, scores = [np.empty(0, dtype=np.int64)], [np.empty(0)]
+        for rows, cols, similarity, _ in self._iter_similar_pairs(ids, offsets, limits):
+            rows, cols = members[rows], members[cols]
+            codes.append(np.minimum(rows, cols) * n + np.maximum(rows, cols))
+            scores.append(similarity)
+        return np.concatenate(codes), np.concatenate(scores)
+
+    def _record_pairs(self, pairs) -> List[Dict]:
+        """
+        Stream (i, j, similarity) pairs to similar_pairs.jsonl as they come.
         
-        return similar_pairs
+        Only the pair count and the SIMILAR_PAIRS_TOP_K most similar pairs
+        (earlier pairs first on ties) are kept, in self.num_similar_pairs
+        and self.duplicates. Lines are spliced from each article's JSON,
+        encoded once, so no per-pair dicts are built.
+        """
+        pairs_file = os.path.join(self.input_dir, "similar_pairs.jsonl")
+        encoded = {}  # article row -> its encoded _article_record
+        top = []
+        count = 0
+        with open(pairs_file, "wb") as f:
+            for i, j, similarity in pairs:
+                for k in (i, j):
+                    if k not in encoded:
+                        encoded[k] = orjson.dumps(self._article_record(k))
+                f.write(
+                    b'{"article1":%b,"article2":%b,"similarity":%b}\n'
+                    % (encoded[i], encoded[j], orjson.dumps(round(similarity, 4)))
+                )
+                
+                entry = (similarity, -count, i, j)
+                if len(top) < SIMILAR_PAIRS_TOP_K:
+                    heapq.heappush(top, entry)
+                else:
+                    heapq.heappushpop(top, entry)
+                count += 1
+        
+        self.num_similar_pairs = count
+        self.duplicates = [
+            self._pair_record(i, j, similarity) for similarity, _, i, j in sorted(top, reverse=True)
+        ]
+        print(f"\nFound {count:,} similar pairs (>= {self.similarity_threshold})")
+        
+        return self.duplicates
+
+    def _pair_record(self, i: int, j: int, similarity: float) -> Dict:
+        """Build the similar_pairs.jsonl entry for articles i and j."""
+        return {
+            "article1": self._article_record(i),
+            "article2": self._article_record(j),
+            "similarity": round(similarity, 4),
+        }
 
-    def cluster_by_exact_match(self) -> List[List[Dict]]:
+    def _article_record(self, k: int) -> Dict:
+        """Title, URL and date of article k, as written to the JSON outputs."""
+        return {
+            "title": self.titles[k],
+            "url": self.urls[k],
+            "date": self.dates[k],
+        }
+
+    def cluster_by_exact_match(self) -> List[List[int]]:
         """
         Cluster articles with identical normalized titles.
         
         Returns:
-            List of clusters (each cluster is a list of articles)
+            List of clusters (each cluster is a list of article row numbers)
         """
         print("\nClustering by exact title match...")
         
-        # Group by normalized title
-        title_groups = defaultdict(list)
-        for article in self.articles:
-            title = article.get("title", "")
-            normalized = self.normalize_text(title)
-            if normalized:
-                title_groups[normalized].append(article)
+        # Group by normalized title: factorize assigns each distinct title a
+        # code (in order of first appearance) using a C hash table
+        normalized = pd.Series([self.normalize_text(title) for title in self.titles], dtype=object)
+        codes, uniques = pd.factorize(normalized)
+        counts = np.bincount(codes, minlength=len(uniques))
+        order = np.argsort(codes, kind="stable")
+        bounds = np.r_[0, np.cumsum(counts)]
         
-        # Keep only clusters with 2+ articles
+        # Keep only clusters with 2+ articles (and a non-empty title)
         clusters = [
-            articles for articles in title_groups.values()
-            if len(articles) >= 2
+            order[bounds[code]:bounds[code + 1]].tolist()
+            for code in np.flatnonzero((counts >= 2) & (uniques != "")).tolist()
         ]
         
         # Sort by cluster size (largest first)
@@ -221,8 +741,8 @@ class SimilarityAnalyzer:
         print("\nGenerating similarity analysis report...")
         
         # Calculate statistics
-        total_articles = len(self.articles)
-        num_similar_pairs = len(self.duplicates)
+        total_articles = len(self.titles)
+        num_similar_pairs = self.num_similar_pairs
         num_clusters = len(self.clusters)
         
         articles_in_clusters = sum(len(cluster) for cluster in self.clusters)
@@ -265,16 +785,19 @@ class SimilarityAnalyzer:
         # Save main report
         report = self.generate_report()
         report_file = os.path.join(self.input_dir, "similarity_report.json")
-        with open(report_file, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        with open(report_file, "wb") as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
         print(f"✓ Saved: {report_file}")
         
-        # Save duplicate pairs
+        # Save duplicate pairs (all of them were streamed to similar_pairs.jsonl)
         if self.duplicates:
+            pairs_file = os.path.join(self.input_dir, "similar_pairs.jsonl")
+            print(f"✓ Saved: {pairs_file} ({self.num_similar_pairs:,} pairs)")
+            
             duplicates_file = os.path.join(self.input_dir, "similar_pairs.json")
-            with open(duplicates_file, "w", encoding="utf-8") as f:
-                json.dump(self.duplicates, f, indent=2, ensure_ascii=False)
-            print(f"✓ Saved: {duplicates_file} ({len(self.duplicates):,} pairs)")
+            with open(duplicates_file, "wb") as f:
+                f.write(orjson.dumps(self.duplicates, option=orjson.OPT_INDENT_2))
+            print(f"✓ Saved: {duplicates_file} (top {len(self.duplicates):,} pairs)")
         
         # Save clusters
         if self.clusters:
@@ -283,21 +806,14 @@ class SimilarityAnalyzer:
                 {
                     "cluster_id": idx + 1,
                     "size": len(cluster),
-                    "normalized_title": self.normalize_text(cluster[0].get("title", "")),
-                    "articles": [
-                        {
-                            "title": article.get("title", ""),
-                            "url": article.get("url", ""),
-                            "date": article.get("date_parsed", ""),
-                        }
-                        for article in cluster
-                    ],
+                    "normalized_title": self.normalize_text(self.titles[cluster[0]]),
+                    "articles": [self._article_record(k) for k in cluster],
                 }
                 for idx, cluster in enumerate(self.clusters[:100])  # Top 100 clusters
             ]
             
-            with open(clusters_file, "w", encoding="utf-8") as f:
-                json.dump(clusters_data, f, indent=2, ensure_ascii=False)
+            with open(clusters_file, "wb") as f:
+                f.write(orjson.dumps(clusters_data, option=orjson.OPT_INDENT_2))
             print(f"✓ Saved: {clusters_file} (top 100 clusters)")
         
         # Save summary CSV
@@ -327,17 +843,17 @@ class SimilarityAnalyzer:
         # Exact match clustering
         self.cluster_by_exact_match()
         
-        # Similar pairs detection (only for reasonable dataset sizes)
-        # Pairwise comparison is O(n²), so we limit by default to prevent memory issues
-        # For larger datasets, consider sampling or using approximate algorithms
+        # Similar pairs detection
+        # Exhaustive pairwise comparison is O(n²), so above this size only
+        # MinHash LSH candidate pairs are scored
         max_articles_for_pairwise = 10000  # Configurable threshold
         
-        if len(self.articles) <= max_articles_for_pairwise:
+        if len(self.titles) <= max_articles_for_pairwise:
             self.find_similar_pairs(ngram_size=3)
         else:
-            print(f"\nSkipping pairwise similarity (dataset too large: {len(self.articles):,} articles)")
-            print(f"Pairwise similarity is O(n²) - limited to {max_articles_for_pairwise:,} articles")
-            print("Consider sampling for large datasets or use exact match clustering only")
+            print(f"\nDataset too large for exhaustive pairwise comparison ({len(self.titles):,} articles)")
+            print(f"Using MinHash LSH above {max_articles_for_pairwise:,} articles")
+            self.find_similar_pairs_lsh(ngram_size=3)
         
         # Generate and save results
         self.save_results()
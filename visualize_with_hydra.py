@@ -22,7 +22,7 @@ Usage:
 import hydra
 from omegaconf import DictConfig, OmegaConf
 import os
-import json
+import orjson
 from q2b_data_visualizer import Q2BDataVisualizer
 
 
@@ -38,12 +38,16 @@ def visualize(cfg: DictConfig) -> None:
     print("Q2BSTUDIO AUDITOR - HYDRA VISUALIZATION")
     print("=" * 60)
     
+    # Convert OmegaConf to a regular dict once; it is used for everything below
+    config_dict = OmegaConf.to_container(cfg, resolve=True)
+    
     # Print the configuration being used
-    print("\nConfiguration:")
-    print(OmegaConf.to_yaml(cfg))
+    if config_dict.get("debug", False):
+        print("\nConfiguration:")
+        print(orjson.dumps(config_dict, option=orjson.OPT_INDENT_2).decode("utf-8"))
     
     # Get checkpoint directory from config
-    checkpoint_dir = cfg.get("checkpoint_dir", None)
+    checkpoint_dir = config_dict.get("checkpoint_dir")
     
     if not checkpoint_dir:
         print("\nError: Please specify checkpoint_dir")
@@ -61,27 +65,28 @@ def visualize(cfg: DictConfig) -> None:
         print("Please run the scraper first to generate the report.")
         return
     
-    with open(report_file, 'r', encoding='utf-8') as f:
-        report = json.load(f)
+    with open(report_file, 'rb') as f:
+        report = orjson.loads(f.read())
     
+    date_range = report['date_range']
     print(f"\nLoaded report from: {checkpoint_dir}")
     print(f"Total articles: {report['total_articles']:,}")
-    print(f"Date range: {report['date_range']['earliest']} to {report['date_range']['latest']}")
-    
-    # Convert OmegaConf to regular dict for compatibility
-    config_dict = OmegaConf.to_container(cfg, resolve=True)
+    print(f"Date range: {date_range['earliest']} to {date_range['latest']}")
     
     # Create visualizer with Hydra config
-    visualizer = Q2BDataVisualizer(input_dir=checkpoint_dir, config=config_dict)
+    fast = config_dict.get("fast", False)
+    visualizer = Q2BDataVisualizer(input_dir=checkpoint_dir, config=config_dict, fast=fast)
     
     # Generate visualizations
     print("\nGenerating visualizations with Hydra configuration...")
     visualizer.create_visualizations(report)
     
     print(f"\n✓ Visualization complete!")
-    print(f"  Graphs saved in: {checkpoint_dir}/{cfg.output.graphs_dir}")
-    print(f"  Theme: {cfg.style.theme}")
-    print(f"  DPI: {cfg.output.dpi}")
+    print(f"  Graphs saved in: {checkpoint_dir}/{config_dict['output']['graphs_dir']}")
+    print(f"  Theme: {config_dict['style']['theme']}")
+    output_cfg = config_dict['output']
+    dpi = output_cfg.get('screen_dpi', 150) if fast else output_cfg['dpi']
+    print(f"  DPI: {dpi}")
 
 
 if __name__ == "__main__":